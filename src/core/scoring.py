@@ -7,20 +7,89 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+try:
+    import numexpr  # multi-threaded array expressions without intermediate arrays
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+
+def _score_catalysts_numba(offsets: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """
+    Average catalyst score per ticker over a CSR layout.
+    Catalysts for ticker i are days[offsets[i]:offsets[i + 1]].
+    """
+    n = offsets.shape[0] - 1
+    scores = np.zeros(n, dtype=np.float32)
+    
+    for i in prange(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+        if end == start:
+            continue
+        
+        total = 0.0
+        for j in range(start, end):
+            if days[j] <= 7:
+                total += 100.0
+            elif days[j] <= 30:
+                total += 50.0
+        
+        scores[i] = min(100.0, total / (end - start))
+    
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    _score_catalysts_numba = njit(cache=True, parallel=True)(_score_catalysts_numba)
+
+
+# Weighted composite over the five component score arrays, for numexpr
+COMPOSITE_EXPRESSION = "m * w_m + v * w_v + rs * w_rs + ns * w_ns + cat * w_cat"
+
+
+# Default scorer thresholds: volume surge as % of average, outperformance vs sector in % points
+VOLUME_SURGE_THRESHOLD = 150
+RELATIVE_STRENGTH_THRESHOLD = 5.0
+
+# Input columns for ScoringEngine.score_batch
+SCORE_BATCH_COLUMNS = [
+    'rsi', 'current_volume', 'avg_volume', 'stock_pct', 'sector_pct',
+    'pos_articles', 'total_articles', 'catalyst_score'
+]
+
 
 class ScoringEngine:
     """Calculates composite scores for trading signals."""
     
+    # Composite weights, in score-matrix column order; override any of them via config['weights']
+    DEFAULT_WEIGHTS = {
+        'momentum': 0.25,
+        'volume': 0.20,
+        'relative_strength': 0.20,
+        'news_sentiment': 0.20,
+        'catalysts': 0.15
+    }
+    
     def __init__(self, config: dict = None):
         """Initialize with configuration."""
         self.config = config or {}
-        self.weights = {
-            'momentum': 0.25,
-            'volume': 0.20,
-            'relative_strength': 0.20,
-            'news_sentiment': 0.20,
-            'catalysts': 0.15
-        }
+        self.weights = {**self.DEFAULT_WEIGHTS, **self.config.get('weights', {})}
+        
+        # Weights resolved once: (momentum, volume, rel strength, news, catalysts)
+        self._weight_vec = np.array([self.weights[name] for name in self.DEFAULT_WEIGHTS], dtype=np.float32)
+    
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """Composite weights as a float32 array in score-matrix column order."""
+        return self._weight_vec
     
     def calculate_momentum_score(self, rsi: float, atr_val: float = None) -> float:
         """
@@ -41,7 +110,29 @@ class ScoringEngine:
         
         return min(100, max(0, score))
     
-    def calculate_volume_score(self, current_volume: float, avg_volume: float, threshold: float = 150) -> float:
+    def calculate_momentum_scores(self, rsi: np.ndarray) -> np.ndarray:
+        """
+        Vectorized momentum score for a whole watchlist.
+        Same mapping as calculate_momentum_score; NaN RSI scores 0.
+        """
+        rsi = np.asarray(rsi, dtype=np.float32)
+        
+        # RSI >= 30 as a sum of clipped ramps: 25 at RSI 30, +25 across 30-70,
+        # +50/30 per point above 70. Computed in place to avoid temporaries.
+        score = np.clip(rsi - 30, 0, 40)
+        score *= 25 / 40
+        score += 25
+        score += np.maximum(rsi - 70, 0) * (50 / 30)
+        
+        # Oversold side only differs below 30
+        oversold = 30 - rsi
+        oversold *= 50 / 30
+        score = np.where(rsi < 30, oversold, score)
+        
+        np.clip(score, 0, 100, out=score)
+        return np.nan_to_num(score, nan=0.0, copy=False)
+    
+    def calculate_volume_score(self, current_volume: float, avg_volume: float, threshold: float = VOLUME_SURGE_THRESHOLD) -> float:
         """
         Calculate volume surge score.
         threshold: minimum % above average to qualify (default 150%)
@@ -58,7 +149,18 @@ class ScoringEngine:
         score = (volume_ratio - threshold) / (threshold * 2) * 100
         return min(100, max(0, score))
     
-    def calculate_relative_strength_score(self, stock_pct_change: float, sector_pct_change: float, min_threshold: float = 5.0) -> float:
+    def calculate_volume_scores(self, current_volume: np.ndarray, avg_volume: np.ndarray, threshold: float = VOLUME_SURGE_THRESHOLD) -> np.ndarray:
+        """Vectorized volume surge score; zero average volume scores 0."""
+        current_volume = np.asarray(current_volume, dtype=np.float32)
+        avg_volume = np.asarray(avg_volume, dtype=np.float32)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = current_volume / avg_volume * 100
+        
+        score = np.clip((volume_ratio - threshold) / (threshold * 2) * 100, 0, 100)
+        return np.where((avg_volume == 0) | (volume_ratio < threshold), 0.0, score)
+    
+    def calculate_relative_strength_score(self, stock_pct_change: float, sector_pct_change: float, min_threshold: float = RELATIVE_STRENGTH_THRESHOLD) -> float:
         """
         Calculate relative strength vs sector.
         Positive diff = stock outperforming sector.
@@ -74,6 +176,16 @@ class ScoringEngine:
             score = 25.0 + (diff - min_threshold) / min_threshold * 75
             return min(100, score)
     
+    def calculate_relative_strength_scores(self, stock_pct_change: np.ndarray, sector_pct_change: np.ndarray, min_threshold: float = RELATIVE_STRENGTH_THRESHOLD) -> np.ndarray:
+        """Vectorized relative strength vs sector."""
+        diff = np.asarray(stock_pct_change, dtype=np.float32) - np.asarray(sector_pct_change, dtype=np.float32)
+        
+        return np.where(
+            diff < -min_threshold,
+            0.0,
+            np.where(diff < min_threshold, 25.0, np.minimum(100, 25.0 + (diff - min_threshold) / min_threshold * 75))
+        )
+    
     def calculate_news_sentiment_score(self, positive_articles: int, total_articles: int) -> float:
         """
         Calculate news sentiment score.
@@ -85,6 +197,16 @@ class ScoringEngine:
         positive_ratio = positive_articles / total_articles
         return positive_ratio * 100
     
+    def calculate_news_sentiment_scores(self, positive_articles: np.ndarray, total_articles: np.ndarray) -> np.ndarray:
+        """Vectorized news sentiment score; tickers without news are neutral (50)."""
+        positive_articles = np.asarray(positive_articles, dtype=np.float32)
+        total_articles = np.asarray(total_articles, dtype=np.float32)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = positive_articles / total_articles * 100
+        
+        return np.where(total_articles == 0, 50.0, score)
+    
     def calculate_catalyst_score(self, catalysts: List[Dict]) -> float:
         """
         Calculate catalyst score based on recency and keyword match.
@@ -104,6 +226,36 @@ class ScoringEngine:
         avg_score = total_score / len(catalysts) if catalysts else 0
         return min(100, avg_score)
     
+    def calculate_catalyst_scores_batch(self, ticker_idx: np.ndarray, days_ago: np.ndarray, n_tickers: int) -> np.ndarray:
+        """
+        Catalyst score for every ticker from flat per-catalyst arrays, as built
+        by SignalProcessor. Catalysts must be grouped by ticker_idx (ascending).
+        Same averaging as calculate_catalyst_score; tickers without catalysts score 0.
+        """
+        ticker_idx = np.asarray(ticker_idx, dtype=np.int64)
+        days_ago = np.asarray(days_ago)
+        
+        if NUMBA_AVAILABLE:
+            offsets = np.searchsorted(ticker_idx, np.arange(n_tickers + 1))
+            return self.calculate_catalyst_scores_csr(offsets, days_ago)
+        
+        points = np.where(days_ago <= 7, 100.0, np.where(days_ago <= 30, 50.0, 0.0))
+        totals = np.bincount(ticker_idx, weights=points, minlength=n_tickers)
+        counts = np.bincount(ticker_idx, minlength=n_tickers)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts > 0, np.minimum(100.0, totals / counts), 0.0).astype(np.float32)
+    
+    def calculate_catalyst_scores_csr(self, offsets: np.ndarray, days_ago: np.ndarray) -> np.ndarray:
+        """
+        Catalyst score for every ticker from a flat (offsets, days_ago) layout.
+        Same averaging as calculate_catalyst_score.
+        """
+        return _score_catalysts_numba(
+            np.asarray(offsets, dtype=np.int64),
+            np.asarray(days_ago, dtype=np.int32)
+        )
+    
     def calculate_composite_score(self,
                                   momentum_score: float,
                                   volume_score: float,
@@ -125,3 +277,63 @@ class ScoringEngine:
         )
         
         return min(100, max(0, composite))
+    
+    def calculate_composite_score_batch(self,
+                                        momentum_scores: np.ndarray,
+                                        volume_scores: np.ndarray,
+                                        rel_strength_scores: np.ndarray,
+                                        news_sentiment_scores: np.ndarray,
+                                        catalyst_scores: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_composite_score over score arrays, using the configured weights."""
+        w_momentum, w_volume, w_rel_strength, w_news, w_catalysts = self._weight_vec
+        
+        if NUMEXPR_AVAILABLE:
+            composite = numexpr.evaluate(COMPOSITE_EXPRESSION, local_dict={
+                'm': momentum_scores, 'v': volume_scores, 'rs': rel_strength_scores,
+                'ns': news_sentiment_scores, 'cat': catalyst_scores,
+                'w_m': w_momentum, 'w_v': w_volume, 'w_rs': w_rel_strength,
+                'w_ns': w_news, 'w_cat': w_catalysts
+            })
+        else:
+            composite = (
+                momentum_scores * w_momentum +
+                volume_scores * w_volume +
+                rel_strength_scores * w_rel_strength +
+                news_sentiment_scores * w_news +
+                catalyst_scores * w_catalysts
+            )
+        
+        return np.clip(composite, 0, 100)
+    
+    def score_batch(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        Score a whole watchlist in one pass.
+        
+        Args:
+            df: DataFrame indexed by ticker with columns rsi, current_volume,
+                avg_volume, stock_pct, sector_pct, pos_articles, total_articles,
+                catalyst_score (see calculate_catalyst_scores_batch)
+                
+        Returns:
+            (composite score Series, DataFrame of component scores)
+        """
+        # Scores are 0-100 percentages; float32 halves the bytes moved with no useful precision lost
+        df = df.astype({column: np.float32 for column in SCORE_BATCH_COLUMNS})
+        
+        m = self.calculate_momentum_scores(df['rsi'].to_numpy())
+        v = self.calculate_volume_scores(df['current_volume'].to_numpy(), df['avg_volume'].to_numpy())
+        rs = self.calculate_relative_strength_scores(df['stock_pct'].to_numpy(), df['sector_pct'].to_numpy())
+        ns = self.calculate_news_sentiment_scores(df['pos_articles'].to_numpy(), df['total_articles'].to_numpy())
+        cat = df['catalyst_score'].to_numpy()
+        
+        components = pd.DataFrame({
+            'momentum_score': m,
+            'volume_score': v,
+            'relative_strength_score': rs,
+            'news_sentiment_score': ns,
+            'catalyst_score': cat
+        }, index=df.index)
+        
+        composite = self.calculate_composite_score_batch(m, v, rs, ns, cat)
+        
+        return pd.Series(composite, index=df.index, name='composite_score'), components
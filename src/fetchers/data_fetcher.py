@@ -4,35 +4,109 @@ Responsible for retrieving market data from external APIs.
 Supports Polygon, Finnhub, and other sources with fallback to mock data.
 """
 
+import asyncio
+import collections
+import hashlib
 import logging
 import requests
-import random
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
 
+try:
+    import pyarrow  # Parquet engine for the response cache
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
-# Data structures for type hints
-class PriceData:
-    """Stock price and volume data."""
-    def __init__(self, ticker: str, price: float, volume: int, rsi: float, atr: float, pct_change: float):
-        self.ticker = ticker
-        self.price = price
-        self.volume = volume
-        self.rsi = rsi
-        self.atr = atr
-        self.pct_change = pct_change
+
+# Columnar layouts for fetcher output (DataFrames indexed by ticker)
+PRICE_COLUMNS = ['price', 'volume', 'rsi', 'atr', 'pct_change', 'volume_20day_avg']
+PRICE_FLOAT32_COLUMNS = ['price', 'rsi', 'atr', 'pct_change']  # volumes stay exact int64
+FUNDAMENTAL_COLUMNS = ['market_cap_millions', 'float_millions', 'pe_ratio']
+
+
+# Mock lookup tables (read-only)
+_BASE_PRICES = MappingProxyType({
+    'AAPL': 150.0, 'MSFT': 370.0, 'TSLA': 92.0,
+    'NVDA': 145.0, 'GOOGL': 155.0, 'XLK': 450.0
+})
+_ETF_PRICES = MappingProxyType({
+    'XLK': 450.0, 'XLF': 35.0, 'XLE': 75.0, 'XLI': 90.0, 'XLV': 140.0
+})
+_FUNDAMENTALS = MappingProxyType({
+    'AAPL': MappingProxyType({'market_cap_millions': 3000000, 'float_millions': 15, 'pe_ratio': 28.5}),
+    'MSFT': MappingProxyType({'market_cap_millions': 2800000, 'float_millions': 7, 'pe_ratio': 32.1}),
+    'TSLA': MappingProxyType({'market_cap_millions': 1200000, 'float_millions': 3, 'pe_ratio': 65.3}),
+})
+_DEFAULT_FUNDAMENTALS = MappingProxyType({
+    'market_cap_millions': 500000,
+    'float_millions': 5,
+    'pe_ratio': 25.0
+})
+
+# Mock news: (headline template, sentiment)
+_MOCK_NEWS_TEMPLATES = (
+    ('{ticker} reports Q4 earnings beat', 'Positive'),
+    ('{ticker} launches new product line', 'Positive'),
+    ('{ticker} CEO discusses expansion plans', 'Neutral'),
+    ('{ticker} faces supply chain challenges', 'Negative'),
+)
+_MOCK_NEWS_SOURCES = ('Reuters', 'Bloomberg', 'CNBC', 'MarketWatch')
+
+
+def _records_to_frame(records: Dict[str, dict], columns: List[str], float32_columns: List[str] = ()) -> pd.DataFrame:
+    """Convert {ticker: record} into a DataFrame indexed by ticker."""
+    frame = pd.DataFrame.from_dict(records, orient='index').reindex(columns=columns)
+    frame.index.name = 'ticker'
+    return frame.astype({column: np.float32 for column in float32_columns})
+
+
+def compute_atr(high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame, n: int = 14) -> pd.DataFrame:
+    """
+    Average True Range with Wilder smoothing (EMA with alpha=1/n).
     
-    def to_dict(self):
-        return {
-            'ticker': self.ticker,
-            'price': self.price,
-            'volume': self.volume,
-            'rsi': self.rsi,
-            'atr': self.atr,
-            'pct_change': self.pct_change
-        }
+    Args:
+        high, low, close: Bars in rows; a Series for one ticker or a
+                          DataFrame with one column per ticker
+        n: ATR period
+        
+    Returns:
+        ATR for every bar, same shape as the inputs
+    """
+    prev_close = close.shift()
+    
+    # fmax skips the NaN previous close on the first bar, leaving high - low
+    true_range = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+    
+    return true_range.ewm(alpha=1 / n, adjust=False).mean()
+
+
+def wilder_averages(close: pd.DataFrame, n: int = 14):
+    """
+    Wilder-smoothed average gain and loss per bar (the RSI building blocks).
+    
+    Returns:
+        (avg_gain, avg_loss), same shape as close
+    """
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0).ewm(alpha=1 / n, adjust=False).mean()
+    avg_loss = (-delta).clip(lower=0).ewm(alpha=1 / n, adjust=False).mean()
+    return avg_gain, avg_loss
 
 
+def rsi_from_averages(avg_gain, avg_loss):
+    """RSI from Wilder averages; no losses means RSI 100."""
+    with np.errstate(divide='ignore'):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+# Data structures for type hints
 class NewsItem:
     """News article and sentiment data."""
     def __init__(self, ticker: str, headline: str, source: str, sentiment: str, timestamp: str, summary: str = ""):
@@ -54,35 +128,173 @@ class NewsItem:
         }
 
 
-class Fundamental:
-    """Fundamental company data."""
-    def __init__(self, ticker: str, market_cap_millions: float, float_millions: float, pe_ratio: float):
-        self.ticker = ticker
-        self.market_cap_millions = market_cap_millions
-        self.float_millions = float_millions
-        self.pe_ratio = pe_ratio
+class _CacheLayer:
+    """
+    On-disk response cache keyed by (endpoint, ticker, date).
     
-    def to_dict(self):
-        return {
-            'ticker': self.ticker,
-            'market_cap_millions': self.market_cap_millions,
-            'float_millions': self.float_millions,
-            'pe_ratio': self.pe_ratio
-        }
+    Each response is stored as {root}/{endpoint}/{hash}.parquet and
+    {root}/metadata.parquet tracks when every key was fetched, so entries
+    older than the endpoint's TTL are refetched.
+    """
+    
+    # Minutes an entry stays fresh, per endpoint
+    DEFAULT_TTL_MINUTES = {'prices': 60, 'news': 15, 'fundamentals': 1440, 'sectors': 60}
+    
+    # Endpoints whose response is a list of records rather than a single record
+    LIST_ENDPOINTS = {'news'}
+    
+    def __init__(self, directory: str, ttl_minutes: Optional[Dict[str, float]] = None):
+        """Initialize cache rooted at directory."""
+        self.root = Path(directory).expanduser()
+        ttls = {**self.DEFAULT_TTL_MINUTES, **(ttl_minutes or {})}
+        self.ttls = {endpoint: timedelta(minutes=minutes) for endpoint, minutes in ttls.items()}
+        self.metadata_path = self.root / 'metadata.parquet'
+        self._metadata = None  # key -> fetched_at, loaded lazily
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def get(self, endpoint: str, ticker: str) -> Optional[Union[dict, List[dict]]]:
+        """Return the cached response, or None if missing or expired."""
+        key = self._key(endpoint, ticker)
+        
+        with self._lock:
+            fetched_at = self._load_metadata().get(key)
+        
+        if fetched_at is None or datetime.now() - fetched_at >= self.ttls[endpoint]:
+            return None
+        
+        path = self._path(endpoint, key)
+        if not path.exists():
+            return None
+        
+        records = pd.read_parquet(path).to_dict('records')
+        return records if endpoint in self.LIST_ENDPOINTS else records[0]
+    
+    def put(self, endpoint: str, ticker: str, response: Union[dict, List[dict]]):
+        """Store a response and record its fetch time."""
+        key = self._key(endpoint, ticker)
+        records = response if endpoint in self.LIST_ENDPOINTS else [response]
+        
+        path = self._path(endpoint, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame.from_records(records).to_parquet(path, index=False)
+        
+        with self._lock:
+            self._load_metadata()[key] = datetime.now()
+            self._dirty = True
+    
+    def flush(self):
+        """Persist fetch times to metadata.parquet."""
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            self.root.mkdir(parents=True, exist_ok=True)
+            pd.DataFrame({
+                'key': list(self._metadata.keys()),
+                'fetched_at': list(self._metadata.values())
+            }).to_parquet(self.metadata_path, index=False)
+            self._dirty = False
+    
+    def _load_metadata(self) -> Dict[str, datetime]:
+        """Load metadata.parquet once; caller must hold the lock."""
+        if self._metadata is None:
+            self._metadata = {}
+            if self.metadata_path.exists():
+                df = pd.read_parquet(self.metadata_path)
+                self._metadata = dict(zip(df['key'], df['fetched_at'].dt.to_pydatetime()))
+        return self._metadata
+    
+    def _key(self, endpoint: str, ticker: str) -> str:
+        return hashlib.blake2b(f"{endpoint}|{ticker}|{date.today().isoformat()}".encode()).hexdigest()
+    
+    def _path(self, endpoint: str, key: str) -> Path:
+        return self.root / endpoint / f"{key}.parquet"
 
 
 class DataFetcher:
     """Fetches price, volume, news, and fundamental data from APIs."""
     
+    # TODO: Read from watchlist file or database
+    DEFAULT_SYMBOLS = ['AAPL', 'MSFT', 'TSLA', 'NVDA', 'GOOGL']
+    SECTOR_ETFS = ['XLK', 'XLF', 'XLE', 'XLI', 'XLV']
+    
+    # Bars of synthetic OHLC history behind mock indicators
+    MOCK_HISTORY_BARS = 30
+    
+    # Chunks stream_symbol_data fetches ahead of its queue
+    MAX_CHUNKS_IN_FLIGHT = 2
+    
     def __init__(self, config: dict):
         """Initialize with configuration."""
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.polygon_api_key = config.get('data_sources', {}).get('polygon_api_key')
         self.finnhub_api_key = config.get('data_sources', {}).get('finnhub_api_key')
-        self.session = requests.Session()
+        self._local = threading.local()  # per-thread session and RNG
+        self.rsi_period = config.get('signals', {}).get('rsi_period', 14)
+        # ticker -> (avg_gain, avg_loss, prev_close), rolled forward one bar per fetch
+        self._rsi_state: Dict[str, Tuple[float, float, float]] = {}
+        self.cache = self._init_cache(config.get('cache', {}))
+    
+    @property
+    def session(self) -> requests.Session:
+        """requests.Session for the calling thread (sessions are not thread-safe)."""
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
     
-    def fetch_price_volume_data(self, symbols: List[str]) -> Dict[str, dict]:
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random generator for mock data, one per thread."""
+        if not hasattr(self._local, 'rng'):
+            self._local.rng = np.random.default_rng()
+        return self._local.rng
+    
+    def _init_cache(self, cache_config: dict) -> Optional[_CacheLayer]:
+        """Create the response cache if enabled in config."""
+        if not cache_config.get('enabled', False):
+            return None
+        
+        if not PARQUET_AVAILABLE:
+            self.logger.warning("pyarrow not installed, response cache disabled")
+            return None
+        
+        return _CacheLayer(
+            cache_config.get('directory', '~/.trading_cache'),
+            cache_config.get('ttl_minutes')
+        )
+    
+    def _cache_get(self, endpoint: str, ticker: str):
+        """Cached response for ticker, or None (also when caching is off)."""
+        return self.cache.get(endpoint, ticker) if self.cache else None
+    
+    def _cache_put(self, endpoint: str, ticker: str, response):
+        """Store response for ticker if caching is on."""
+        if self.cache:
+            self.cache.put(endpoint, ticker, response)
+    
+    def _fill_with_mock(self, endpoint: str, data: Dict, missing: List[str]):
+        """
+        Generate mock responses for all missing tickers in one batch.
+        Mock data is never cached, so a real response replaces it on the next fetch.
+        """
+        if missing:
+            data.update(self._mock_records(endpoint, missing))
+    
+    def _mock_records(self, endpoint: str, tickers: List[str]) -> Dict:
+        """Mock responses for tickers as {ticker: record}."""
+        if endpoint == 'news':
+            return {ticker: self._mock_news_data(ticker) for ticker in tickers}
+        
+        mock_batch = {
+            'prices': self._mock_price_data_batch,
+            'fundamentals': self._mock_fundamental_data_batch,
+            'sectors': self._mock_sector_data_batch
+        }[endpoint]
+        return mock_batch(tickers).to_dict('index')
+    
+    def fetch_price_volume_data(self, symbols: List[str]) -> pd.DataFrame:
         """
         Fetch price and volume data from Polygon or mock data.
         
@@ -90,13 +302,19 @@ class DataFetcher:
             symbols: List of stock tickers
             
         Returns:
-            Dict with ticker: {price, volume, rsi, atr, pct_change, 20day_avg_volume}
+            DataFrame indexed by ticker with PRICE_COLUMNS
         """
-        self.logger.info(f"Fetching price/volume data for {len(symbols)} symbols...")
+        self.logger.info("Fetching price/volume data for %d symbols...", len(symbols))
         
         data = {}
+        missing = []
         
         for ticker in symbols:
+            cached = self._cache_get('prices', ticker)
+            if cached is not None:
+                data[ticker] = cached
+                continue
+            
             try:
                 # Attempt real API call if key is set
                 if self.polygon_api_key and self.polygon_api_key != "YOUR_POLYGON_API_KEY":
@@ -104,14 +322,21 @@ class DataFetcher:
                     # https://polygon.io/docs/stocks/get-previous-close
                     pass
                 
-                # Fallback: Mock data for testing
-                data[ticker] = self._mock_price_data(ticker)
+                # Fallback: Mock data for testing (generated for all misses at once below)
+                missing.append(ticker)
             
             except Exception as e:
-                self.logger.warning(f"Failed to fetch price data for {ticker}: {e}")
-                data[ticker] = self._mock_price_data(ticker)
+                self.logger.warning("Failed to fetch price data for %s: %s", ticker, e)
+                missing.append(ticker)
         
-        return data
+        self._fill_with_mock('prices', data, missing)
+        
+        if self.cache:
+            self.cache.flush()
+        
+        return self._apply_incremental_rsi(
+            _records_to_frame({ticker: data[ticker] for ticker in symbols}, PRICE_COLUMNS, PRICE_FLOAT32_COLUMNS)
+        )
     
     def fetch_news_data(self, symbols: List[str]) -> Dict[str, List[dict]]:
         """
@@ -123,11 +348,17 @@ class DataFetcher:
         Returns:
             Dict with ticker: [list of news articles as dicts]
         """
-        self.logger.info(f"Fetching news data for {len(symbols)} symbols...")
+        self.logger.info("Fetching news data for %d symbols...", len(symbols))
         
         data = {}
+        missing = []
         
         for ticker in symbols:
+            cached = self._cache_get('news', ticker)
+            if cached is not None:
+                data[ticker] = cached
+                continue
+            
             try:
                 # Attempt real API call if key is set
                 if self.finnhub_api_key and self.finnhub_api_key != "YOUR_FINNHUB_API_KEY":
@@ -135,16 +366,21 @@ class DataFetcher:
                     # https://finnhub.io/docs/api/company-news
                     pass
                 
-                # Fallback: Mock news for testing
-                data[ticker] = self._mock_news_data(ticker)
+                # Fallback: Mock news for testing (generated for all misses below)
+                missing.append(ticker)
             
             except Exception as e:
-                self.logger.warning(f"Failed to fetch news data for {ticker}: {e}")
-                data[ticker] = self._mock_news_data(ticker)
+                self.logger.warning("Failed to fetch news data for %s: %s", ticker, e)
+                missing.append(ticker)
         
-        return data
+        self._fill_with_mock('news', data, missing)
+        
+        if self.cache:
+            self.cache.flush()
+        
+        return {ticker: data[ticker] for ticker in symbols}
     
-    def fetch_fundamentals(self, symbols: List[str]) -> Dict[str, dict]:
+    def fetch_fundamentals(self, symbols: List[str]) -> pd.DataFrame:
         """
         Fetch fundamental data from Financial Modeling Prep or mock data.
         
@@ -152,13 +388,19 @@ class DataFetcher:
             symbols: List of stock tickers
             
         Returns:
-            Dict with ticker: {market_cap_millions, float_millions, pe_ratio}
+            DataFrame indexed by ticker with FUNDAMENTAL_COLUMNS
         """
-        self.logger.info(f"Fetching fundamentals for {len(symbols)} symbols...")
+        self.logger.info("Fetching fundamentals for %d symbols...", len(symbols))
         
         data = {}
+        missing = []
         
         for ticker in symbols:
+            cached = self._cache_get('fundamentals', ticker)
+            if cached is not None:
+                data[ticker] = cached
+                continue
+            
             try:
                 # Attempt real API call if key is set
                 if self.finnhub_api_key and self.finnhub_api_key != "YOUR_FINNHUB_API_KEY":
@@ -166,14 +408,19 @@ class DataFetcher:
                     # https://finnhub.io/docs/api/company-profile
                     pass
                 
-                # Fallback: Mock data for testing
-                data[ticker] = self._mock_fundamental_data(ticker)
+                # Fallback: Mock data for testing (generated for all misses at once below)
+                missing.append(ticker)
             
             except Exception as e:
-                self.logger.warning(f"Failed to fetch fundamentals for {ticker}: {e}")
-                data[ticker] = self._mock_fundamental_data(ticker)
+                self.logger.warning("Failed to fetch fundamentals for %s: %s", ticker, e)
+                missing.append(ticker)
+        
+        self._fill_with_mock('fundamentals', data, missing)
         
-        return data
+        if self.cache:
+            self.cache.flush()
+        
+        return _records_to_frame({ticker: data[ticker] for ticker in symbols}, FUNDAMENTAL_COLUMNS)
     
     def fetch_sector_data(self, sector_etfs: List[str]) -> Dict[str, dict]:
         """
@@ -185,25 +432,36 @@ class DataFetcher:
         Returns:
             Dict with etf: {price, pct_change}
         """
-        self.logger.info(f"Fetching sector ETF data for {len(sector_etfs)} ETFs...")
+        self.logger.info("Fetching sector ETF data for %d ETFs...", len(sector_etfs))
         
         data = {}
+        missing = []
         
         for etf in sector_etfs:
+            cached = self._cache_get('sectors', etf)
+            if cached is not None:
+                data[etf] = cached
+                continue
+            
             try:
                 # Attempt real API call if key is set
                 if self.polygon_api_key and self.polygon_api_key != "YOUR_POLYGON_API_KEY":
                     # TODO: Implement Polygon API call for ETF data
                     pass
                 
-                # Fallback: Mock sector data
-                data[etf] = self._mock_sector_data(etf)
+                # Fallback: Mock sector data (generated for all misses at once below)
+                missing.append(etf)
             
             except Exception as e:
-                self.logger.warning(f"Failed to fetch sector data for {etf}: {e}")
-                data[etf] = self._mock_sector_data(etf)
+                self.logger.warning("Failed to fetch sector data for %s: %s", etf, e)
+                missing.append(etf)
+        
+        self._fill_with_mock('sectors', data, missing)
+        
+        if self.cache:
+            self.cache.flush()
         
-        return data
+        return {etf: data[etf] for etf in sector_etfs}
     
     def fetch_all_data(self) -> Dict:
         """
@@ -214,97 +472,239 @@ class DataFetcher:
         """
         self.logger.info("Starting data fetch cycle...")
         
-        # TODO: Read from watchlist file or database
-        default_symbols = ['AAPL', 'MSFT', 'TSLA', 'NVDA', 'GOOGL']
-        sector_etfs = ['XLK', 'XLF', 'XLE', 'XLI', 'XLV']
+        default_symbols = self.DEFAULT_SYMBOLS
+        sector_etfs = self.SECTOR_ETFS
         
-        all_data = {
-            'timestamp': datetime.now().isoformat(),
-            'prices': self.fetch_price_volume_data(default_symbols),
-            'news': self.fetch_news_data(default_symbols),
-            'fundamentals': self.fetch_fundamentals(default_symbols),
-            'sectors': self.fetch_sector_data(sector_etfs)
-        }
+        # The four categories are independent; fetch them in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            prices = executor.submit(self.fetch_price_volume_data, default_symbols)
+            news = executor.submit(self.fetch_news_data, default_symbols)
+            fundamentals = executor.submit(self.fetch_fundamentals, default_symbols)
+            sectors = executor.submit(self.fetch_sector_data, sector_etfs)
+            
+            all_data = {
+                'timestamp': datetime.now().isoformat(),
+                'prices': prices.result(),
+                'news': news.result(),
+                'fundamentals': fundamentals.result(),
+                'sectors': sectors.result()
+            }
         
         return all_data
     
-    # ===== MOCK DATA GENERATORS (for testing without API keys) =====
+    async def stream_symbol_data(self, symbols: List[str], queue: asyncio.Queue, batch_size: int = 256):
+        """
+        Producer for the fetch -> score pipeline.
+        
+        Fetches symbols in chunks of batch_size and puts each chunk's market
+        data (see _fetch_symbol_batch) on queue in symbol order, then a final None
+        sentinel. At most MAX_CHUNKS_IN_FLIGHT chunks are fetched ahead of the
+        queue; the next one starts only once a batch has been put, so a bounded
+        queue applies back-pressure when scoring falls behind.
+        
+        Args:
+            symbols: Tickers to fetch
+            queue: Queue shared with the consumer
+            batch_size: Tickers per chunk
+        """
+        chunks = (symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size))
+        in_flight = collections.deque()
+        
+        def start_next():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                in_flight.append(asyncio.create_task(self._fetch_symbol_batch(chunk)))
+        
+        try:
+            for _ in range(self.MAX_CHUNKS_IN_FLIGHT):
+                start_next()
+            while in_flight:
+                await queue.put(await in_flight[0])
+                in_flight.popleft()
+                start_next()
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            # The run has failed (or the consumer is gone and cancelled us), so
+            # drop queued batches rather than wait on a full queue for the sentinel
+            while queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            raise
+        else:
+            await queue.put(None)
     
-    def _mock_price_data(self, ticker: str) -> dict:
-        """Generate realistic mock price data."""
-        base_prices = {
-            'AAPL': 150.0, 'MSFT': 370.0, 'TSLA': 92.0,
-            'NVDA': 145.0, 'GOOGL': 155.0, 'XLK': 450.0
-        }
+    def merge_batches(self, batches: List[Dict], symbols: List[str], sectors: Dict) -> Dict:
+        """
+        Combine assembled batches into the fetch_all_data structure, in symbol order.
+        
+        Returns:
+            Same structure as fetch_all_data
+        """
+        if batches:
+            prices = pd.concat([batch['prices'] for batch in batches]).reindex(symbols)
+            fundamentals = pd.concat([batch['fundamentals'] for batch in batches]).reindex(symbols)
+        else:
+            prices = _records_to_frame({}, PRICE_COLUMNS, PRICE_FLOAT32_COLUMNS)
+            fundamentals = _records_to_frame({}, FUNDAMENTAL_COLUMNS)
         
-        base_price = base_prices.get(ticker, 100.0)
-        price = base_price + random.uniform(-5, 5)
-        volume = random.randint(50000000, 150000000)
-        rsi = random.uniform(30, 70)
-        atr = random.uniform(1.0, 3.0)
-        pct_change = random.uniform(-3.0, 5.0)
+        news = {}
+        for batch in batches:
+            news.update(batch['news'])
+        news = {ticker: news[ticker] for ticker in symbols if ticker in news}
         
         return {
-            'ticker': ticker,
-            'price': round(price, 2),
-            'volume': volume,
-            'rsi': round(rsi, 2),
-            'atr': round(atr, 2),
-            'pct_change': round(pct_change, 2),
-            'volume_20day_avg': volume - random.randint(10000000, 50000000)
+            'timestamp': datetime.now().isoformat(),
+            'prices': prices,
+            'news': news,
+            'fundamentals': fundamentals,
+            'sectors': sectors
         }
     
+    async def _fetch_symbol_batch(self, symbols: List[str]) -> Dict:
+        """
+        Prices, news and fundamentals for one chunk of symbols through the sync
+        fetch_* methods, run in a worker thread to keep them off the event loop.
+        
+        Returns:
+            Dict with prices/fundamentals DataFrames and news dict for the chunk
+        """
+        def fetch():
+            return {
+                'prices': self.fetch_price_volume_data(symbols),
+                'news': self.fetch_news_data(symbols),
+                'fundamentals': self.fetch_fundamentals(symbols)
+            }
+        
+        return await asyncio.to_thread(fetch)
+    
+    def update_rsi(self, ticker: str, close: float) -> Optional[float]:
+        """
+        Roll ticker's RSI forward by one bar in O(1) using Wilder's smoothing.
+        
+        Returns:
+            Updated RSI, or None if the ticker has no RSI state yet
+        """
+        state = self._rsi_state.get(ticker)
+        if state is None:
+            return None
+        
+        avg_gain, avg_loss, prev_close = state
+        n = self.rsi_period
+        delta = close - prev_close
+        avg_gain = (avg_gain * (n - 1) + max(delta, 0.0)) / n
+        avg_loss = (avg_loss * (n - 1) + max(-delta, 0.0)) / n
+        self._rsi_state[ticker] = (avg_gain, avg_loss, close)
+        
+        return 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+    
+    def _apply_incremental_rsi(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace RSI with the incrementally updated value for tracked tickers.
+        A close equal to the previous one (e.g. a cached quote) is not a new bar.
+        """
+        rsi = prices['rsi'].to_numpy(dtype=np.float64, copy=True)
+        
+        for i, (ticker, close) in enumerate(zip(prices.index, prices['price'])):
+            state = self._rsi_state.get(ticker)
+            if state is not None and close != state[2]:
+                rsi[i] = self.update_rsi(ticker, close)
+        
+        prices['rsi'] = np.round(rsi, 2).astype(np.float32)
+        return prices
+    
+    # ===== MOCK DATA GENERATORS (for testing without API keys) =====
+    
+    def _mock_price_data_batch(self, tickers: List[str]) -> pd.DataFrame:
+        """Generate realistic mock price data for all tickers in one pass."""
+        n = len(tickers)
+        base = np.fromiter((_BASE_PRICES.get(ticker, 100.0) for ticker in tickers), dtype=np.float64, count=n)
+        prices = np.round(base + self.rng.uniform(-5, 5, n), 2)
+        volumes = self.rng.integers(50_000_000, 150_000_000, n, endpoint=True)
+        
+        high, low, close = self._mock_ohlc_history(tickers, prices)
+        atr = compute_atr(high, low, close).iloc[-1].to_numpy()
+        
+        # Seed RSI state up to the previous bar; the latest bar is applied
+        # incrementally like any fetched quote
+        avg_gain, avg_loss = wilder_averages(close, self.rsi_period)
+        for ticker, gain, loss, prev_close in zip(tickers, avg_gain.iloc[-2], avg_loss.iloc[-2], close.iloc[-2]):
+            self._rsi_state.setdefault(ticker, (gain, loss, prev_close))
+        rsi = rsi_from_averages(avg_gain.iloc[-1], avg_loss.iloc[-1]).to_numpy()
+        
+        return pd.DataFrame({
+            'price': prices.astype(np.float32),
+            'volume': volumes,
+            'rsi': np.round(rsi, 2).astype(np.float32),
+            'atr': np.round(atr, 2).astype(np.float32),
+            'pct_change': np.round(self.rng.uniform(-3.0, 5.0, n), 2).astype(np.float32),
+            'volume_20day_avg': volumes - self.rng.integers(10_000_000, 50_000_000, n, endpoint=True)
+        }, index=pd.Index(tickers, name='ticker'))
+    
     def _mock_news_data(self, ticker: str) -> List[dict]:
         """Generate realistic mock news data."""
-        news_templates = [
-            {'headline': f'{ticker} reports Q4 earnings beat', 'sentiment': 'Positive'},
-            {'headline': f'{ticker} launches new product line', 'sentiment': 'Positive'},
-            {'headline': f'{ticker} CEO discusses expansion plans', 'sentiment': 'Neutral'},
-            {'headline': f'{ticker} faces supply chain challenges', 'sentiment': 'Negative'},
-        ]
-        
-        selected = news_templates[:random.randint(1, 3)]
-        for item in selected:
-            item['ticker'] = ticker
-            item['source'] = random.choice(['Reuters', 'Bloomberg', 'CNBC', 'MarketWatch'])
-            item['timestamp'] = (datetime.now() - timedelta(hours=random.randint(0, 24))).isoformat()
-            item['summary'] = f"AI-generated summary of {item['headline']}"
-        
-        return [news_dict for news_dict in selected]
-    
-    def _mock_fundamental_data(self, ticker: str) -> dict:
-        """Generate realistic mock fundamental data."""
-        fundamentals = {
-            'AAPL': {'market_cap_millions': 3000000, 'float_millions': 15, 'pe_ratio': 28.5},
-            'MSFT': {'market_cap_millions': 2800000, 'float_millions': 7, 'pe_ratio': 32.1},
-            'TSLA': {'market_cap_millions': 1200000, 'float_millions': 3, 'pe_ratio': 65.3},
-        }
+        count = int(self.rng.integers(1, 3, endpoint=True))
+        source_idx = self.rng.integers(0, len(_MOCK_NEWS_SOURCES), count)
+        hours_ago = self.rng.integers(0, 24, count, endpoint=True)
+        now = datetime.now()
         
-        base = fundamentals.get(ticker, {
-            'market_cap_millions': 500000,
-            'float_millions': 5,
-            'pe_ratio': 25.0
-        })
+        # Fresh dicts per call; the templates themselves are never mutated
+        articles = []
+        for (headline, sentiment), source, hours in zip(_MOCK_NEWS_TEMPLATES[:count], source_idx, hours_ago):
+            headline = headline.format(ticker=ticker)
+            articles.append({
+                'headline': headline,
+                'sentiment': sentiment,
+                'ticker': ticker,
+                'source': _MOCK_NEWS_SOURCES[source],
+                'timestamp': (now - timedelta(hours=int(hours))).isoformat(),
+                'summary': f"AI-generated summary of {headline}"
+            })
         
-        return {
-            'ticker': ticker,
-            'market_cap_millions': base['market_cap_millions'],
-            'float_millions': base['float_millions'],
-            'pe_ratio': base['pe_ratio']
-        }
+        return articles
     
-    def _mock_sector_data(self, etf: str) -> dict:
-        """Generate realistic mock sector ETF data."""
-        etf_prices = {
-            'XLK': 450.0, 'XLF': 35.0, 'XLE': 75.0, 'XLI': 90.0, 'XLV': 140.0
-        }
+    def _mock_ohlc_history(self, tickers: List[str], last_close: np.ndarray):
+        """
+        Random-walk daily bars ending at last_close, one column per ticker.
+        Each ticker gets a daily range scale of 1-3 points.
         
-        base_price = etf_prices.get(etf, 100.0)
-        price = base_price + random.uniform(-2, 2)
-        pct_change = random.uniform(-2.0, 2.0)
+        Returns:
+            (high, low, close) DataFrames of MOCK_HISTORY_BARS rows
+        """
+        bars, n = self.MOCK_HISTORY_BARS, len(tickers)
+        range_scale = self.rng.uniform(1.0, 3.0, n)
         
-        return {
-            'etf': etf,
-            'price': round(price, 2),
-            'pct_change': round(pct_change, 2)
-        }
+        steps = self.rng.normal(0, 0.5, (bars, n)) * range_scale
+        close = np.cumsum(steps, axis=0)
+        close += last_close - close[-1]
+        open_ = close - steps
+        
+        wick_high = self.rng.uniform(0, 0.5, (bars, n)) * range_scale
+        wick_low = self.rng.uniform(0, 0.5, (bars, n)) * range_scale
+        high = np.maximum(open_, close) + wick_high
+        low = np.minimum(open_, close) - wick_low
+        
+        return (
+            pd.DataFrame(high, columns=tickers),
+            pd.DataFrame(low, columns=tickers),
+            pd.DataFrame(close, columns=tickers)
+        )
+    
+    def _mock_fundamental_data_batch(self, tickers: List[str]) -> pd.DataFrame:
+        """Generate realistic mock fundamental data for all tickers in one pass."""
+        return pd.DataFrame(
+            [dict(_FUNDAMENTALS.get(ticker, _DEFAULT_FUNDAMENTALS)) for ticker in tickers],
+            index=pd.Index(tickers, name='ticker'),
+            columns=FUNDAMENTAL_COLUMNS
+        )
+    
+    def _mock_sector_data_batch(self, etfs: List[str]) -> pd.DataFrame:
+        """Generate realistic mock sector ETF data for all ETFs in one pass."""
+        n = len(etfs)
+        base = np.fromiter((_ETF_PRICES.get(etf, 100.0) for etf in etfs), dtype=np.float64, count=n)
+        
+        return pd.DataFrame({
+            'price': np.round(base + self.rng.uniform(-2, 2, n), 2),
+            'pct_change': np.round(self.rng.uniform(-2.0, 2.0, n), 2)
+        }, index=pd.Index(etfs, name='etf'))
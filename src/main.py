@@ -3,26 +3,37 @@ Main entry point for AI Trading Assistant.
 Orchestrates data fetching, signal generation, and Excel output.
 """
 
+import argparse
+import asyncio
 import json
 import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+import pandas as pd
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import orjson
+    _loads = orjson.loads  # C parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _loads = json.loads
 
-from fetchers.data_fetcher import DataFetcher
-from processors.signal_processor import SignalProcessor
-from utils.excel_writer import ExcelWriter
-from utils.logger import setup_logger
+# Add the repo root to path so `python src/main.py` imports the src package
+# under the same names as tests and `python -m src.main` (numba's kernel cache
+# records the module name)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.fetchers.data_fetcher import DataFetcher
+from src.processors.signal_processor import SignalProcessor
+from src.utils.excel_writer import ExcelWriter
+from src.utils.logger import setup_logger
 
 
 def load_config(config_path: str = "config/default_config.json") -> dict:
     """Load configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = _loads(f.read())
         print(f"✓ Config loaded from {config_path}")
         return config
     except FileNotFoundError:
@@ -31,7 +42,44 @@ def load_config(config_path: str = "config/default_config.json") -> dict:
         raise ValueError(f"Invalid JSON in config file: {e}")
 
 
-def run_trading_analysis():
+async def run_pipeline(fetcher: DataFetcher, processor: SignalProcessor, batch_size: int = 256):
+    """
+    Overlap fetching and scoring with a producer/consumer queue.
+    
+    The fetcher streams batches of batch_size tickers onto a bounded queue as
+    they arrive while this coroutine filters and scores them in a worker
+    thread, so scoring runs during network waits instead of after the last
+    response. Signals are ranked once all batches are scored.
+    
+    Args:
+        fetcher: Data fetcher (producer)
+        processor: Signal processor (consumer)
+        batch_size: Tickers fetched and scored per batch
+        
+    Returns:
+        (ranked signals, market data in the fetch_all_data structure)
+    """
+    symbols = fetcher.DEFAULT_SYMBOLS
+    queue = asyncio.Queue(maxsize=8)
+    
+    # Relative strength needs every sector ETF before the first batch is scored
+    sectors_task = asyncio.create_task(asyncio.to_thread(fetcher.fetch_sector_data, fetcher.SECTOR_ETFS))
+    producer = asyncio.create_task(fetcher.stream_symbol_data(symbols, queue, batch_size))
+    sectors = await sectors_task
+    
+    batches, signal_frames = [], []
+    while (batch := await queue.get()) is not None:
+        signal_frames.append(await asyncio.to_thread(processor.process_batch, batch, sectors))
+        batches.append(batch)
+    
+    await producer
+    
+    signals = pd.concat(signal_frames, ignore_index=True) if signal_frames else []
+    
+    return processor.rank_signals(signals), fetcher.merge_batches(batches, symbols, sectors)
+
+
+def run_trading_analysis(use_cache: bool = True):
     """
     Main workflow:
     1. Load configuration
@@ -40,6 +88,9 @@ def run_trading_analysis():
     4. Filter and rank signals
     5. Generate Excel output
     6. Send alerts (if applicable)
+    
+    Args:
+        use_cache: Serve API responses from the on-disk cache when fresh
     """
     
     logger = setup_logger("trading_assistant")
@@ -52,22 +103,19 @@ def run_trading_analysis():
         # 1. Load config
         logger.info("Loading configuration...")
         config = load_config()
+        if not use_cache:
+            config.setdefault('cache', {})['enabled'] = False
         
-        # 2. Fetch data
-        logger.info("Fetching market data...")
+        # 2-3. Fetch data and process signals as it streams in
+        logger.info("Fetching market data and processing signals...")
         fetcher = DataFetcher(config)
-        market_data = fetcher.fetch_all_data()
+        processor = SignalProcessor(config)
+        signals_ranked, market_data = asyncio.run(run_pipeline(fetcher, processor))
         
         logger.info(f"  - Fetched {len(market_data.get('prices', {}))} price quotes")
         logger.info(f"  - Fetched {sum(len(v) for v in market_data.get('news', {}).values())} news items")
         logger.info(f"  - Fetched {len(market_data.get('fundamentals', {}))} fundamentals")
         logger.info(f"  - Fetched {len(market_data.get('sectors', {}))} sector ETFs")
-        
-        # 3. Process signals
-        logger.info("Processing signals...")
-        processor = SignalProcessor(config)
-        signals_ranked = processor.process_data(market_data)
-        
         logger.info(f"  - Generated {len(signals_ranked)} ranked signals")
         
         # 4. Generate Excel
@@ -93,5 +141,9 @@ def run_trading_analysis():
 
 
 if __name__ == "__main__":
-    output = run_trading_analysis()
+    parser = argparse.ArgumentParser(description="AI Trading Assistant signal generation")
+    parser.add_argument('--no-cache', action='store_true', help="Ignore the on-disk API response cache")
+    args = parser.parse_args()
+    
+    output = run_trading_analysis(use_cache=not args.no_cache)
     sys.exit(0 if output else 1)
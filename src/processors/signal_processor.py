@@ -4,20 +4,151 @@ Applies filters, calculates scores, generates ranked trading signals.
 """
 
 import logging
-from typing import Dict, List, Optional
-from src.core.scoring import ScoringEngine
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Union
+from src.core.scoring import RELATIVE_STRENGTH_THRESHOLD, VOLUME_SURGE_THRESHOLD, ScoringEngine
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+# Age given to catalyst articles without a timestamp, as in calculate_catalyst_score (scores 0)
+UNDATED_CATALYST_DAYS = 999
+
+# Simplified stock -> sector ETF mapping; in production, use a database
+SECTOR_MAP = MappingProxyType({
+    'AAPL': 'XLK', 'MSFT': 'XLK', 'GOOGL': 'XLK',  # Tech
+    'JPM': 'XLF', 'BAC': 'XLF',  # Finance
+    'XOM': 'XLE', 'CVX': 'XLE',  # Energy
+    'JNJ': 'XLV', 'PFE': 'XLV',  # Healthcare
+})
+DEFAULT_SECTOR_ETF = 'XLK'  # Default to tech
+
+# Rows of _score_signals_kernel output
+FUSED_SCORE_COLUMNS = [
+    'composite_score', 'momentum_score', 'volume_score', 'relative_strength_score',
+    'news_sentiment_score', 'catalyst_score', 'risk_score'
+]
+
+
+def _score_signals_kernel(rsi, current_volume, avg_volume, stock_pct, sector_pct,
+                          pos_articles, total_articles, catalyst_scores, atr, price,
+                          weights, volume_threshold, rs_threshold):
+    """
+    All five component scores, the composite and the risk score in one pass per ticker.
+    
+    Same formulas (and NaN handling) as the vectorized ScoringEngine methods
+    used by score_batch and SignalProcessor._calculate_risk_score_batch, with
+    no intermediate arrays. volume_threshold and rs_threshold are the volume
+    surge and relative strength thresholds those methods take.
+    
+    Returns:
+        (7, N) float32 array, rows in FUSED_SCORE_COLUMNS order
+    """
+    n = rsi.shape[0]
+    out = np.empty((7, n), dtype=np.float32)
+    
+    for i in prange(n):
+        # Momentum: RSI ramps; NaN RSI scores 0
+        r = rsi[i]
+        if r < 30:
+            m = (30 - r) / 30 * 50
+        elif r > 70:
+            m = (r - 70) / 30 * 50 + 50
+        elif r >= 30:
+            m = 25 + (r - 30) / 40 * 25
+        else:
+            m = 0.0
+        m = min(100.0, max(0.0, m))
+        
+        # Volume surge vs threshold % of average
+        avg = avg_volume[i]
+        ratio = current_volume[i] / avg * 100 if avg != 0 else 0.0
+        if avg == 0 or ratio < volume_threshold:
+            v = 0.0
+        elif ratio != ratio:
+            v = np.nan
+        else:
+            v = min(100.0, max(0.0, (ratio - volume_threshold) / (volume_threshold * 2) * 100))
+        
+        # Relative strength vs sector
+        diff = stock_pct[i] - sector_pct[i]
+        if diff < -rs_threshold:
+            rs = 0.0
+        elif diff < rs_threshold:
+            rs = 25.0
+        elif diff != diff:
+            rs = np.nan
+        else:
+            rs = min(100.0, 25.0 + (diff - rs_threshold) / rs_threshold * 75)
+        
+        # News sentiment; no articles is neutral
+        total = total_articles[i]
+        ns = 50.0 if total == 0 else pos_articles[i] / total * 100
+        
+        # Catalyst scores come pre-averaged from calculate_catalyst_scores_batch
+        cat = catalyst_scores[i]
+        
+        composite = m * weights[0] + v * weights[1] + rs * weights[2] + ns * weights[3] + cat * weights[4]
+        
+        # Risk from ATR as % of price, in float64 like the scalar version
+        p = np.float64(price[i])
+        atr_pct = np.float64(atr[i]) / p * 100 if p > 0 else 0.0
+        if atr_pct < 1:
+            risk = 20.0
+        elif atr_pct > 5:
+            risk = 80.0
+        else:
+            risk = 20 + atr_pct / 5 * 60
+        if risk != risk:
+            risk = 0.0
+        
+        out[0, i] = min(100.0, max(0.0, composite))
+        out[1, i] = m
+        out[2, i] = v
+        out[3, i] = rs
+        out[4, i] = ns
+        out[5, i] = cat
+        out[6, i] = risk
+    
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # fastmath minus nnan/ninf so the explicit NaN checks keep working
+    _score_signals_kernel = njit(cache=True, parallel=True,
+                                 fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})(_score_signals_kernel)
 
 
 class SignalProcessor:
     """Processes market data and generates ranked trading signals."""
     
+    # Headline keywords that flag a catalyst; matched as case-insensitive substrings
+    CATALYST_KEYWORDS = ('beat', 'launch', 'expansion', 'partnership', 'acquisition')
+    _CATALYST_RE = re.compile('|'.join(map(re.escape, CATALYST_KEYWORDS)), re.IGNORECASE)
+    
     def __init__(self, config: dict):
         """Initialize with configuration and scoring engine."""
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.scoring_engine = ScoringEngine()
+        self.scoring_engine = ScoringEngine(config)
+        if NUMBA_AVAILABLE:
+            # Compile (or load cached) kernel now so the first process_data doesn't pay for it
+            one = np.ones(1, dtype=np.float32)
+            _score_signals_kernel(one, one, one, one, one, one, one, one, one, one, np.ones(5, dtype=np.float32),
+                                  VOLUME_SURGE_THRESHOLD, RELATIVE_STRENGTH_THRESHOLD)
         self.filters = config.get('filters', {})
         self.signals_config = config.get('signals', {})
+        self._universe_cache = None  # (prices, fundamentals, require_fundamentals, arrays)
     
     def process_data(self, market_data: Dict) -> List[Dict]:
         """
@@ -31,87 +162,95 @@ class SignalProcessor:
         """
         self.logger.info("Processing market data into signals...")
         
-        # Step 1: Apply filters
+        # Steps 1-2: Apply filters, score each symbol using all 5 metrics
+        signals = self.process_batch(market_data, market_data.get('sectors', {}))
+        
+        # Step 3: Rank, apply risk controls, return top signals
+        ranked_signals = self.rank_signals(signals)
+        
+        self.logger.info(f"Final ranked signals: {len(ranked_signals)}")
+        
+        return ranked_signals
+    
+    def process_batch(self, batch: Dict, sectors: Dict) -> pd.DataFrame:
+        """
+        Filter and score one batch of symbols without ranking.
+        
+        Used directly by the streaming pipeline, which ranks once after the
+        last batch; sectors are shared across batches.
+        
+        Args:
+            batch: Dict with prices, news, fundamentals for the batch's symbols
+            sectors: Sector ETF data
+            
+        Returns:
+            Unranked signal DataFrame (see generate_signal_frame)
+        """
         filtered_symbols = self.apply_filters(
-            market_data.get('prices', {}),
-            market_data.get('fundamentals', {})
+            batch.get('prices', {}),
+            batch.get('fundamentals', {})
         )
         self.logger.info(f"After filters: {len(filtered_symbols)} symbols remain")
         
-        # Step 2: Score each symbol using all 5 metrics
-        signals = self.generate_signals(
+        signals = self.generate_signal_frame(
             filtered_symbols,
-            market_data.get('prices', {}),
-            market_data.get('news', {}),
-            market_data.get('fundamentals', {}),
-            market_data.get('sectors', {})
+            batch.get('prices', {}),
+            batch.get('news', {}),
+            batch.get('fundamentals', {}),
+            sectors
         )
         self.logger.info(f"Generated {len(signals)} scoring signals")
         
-        # Step 3: Rank, apply risk controls, return top signals
-        ranked_signals = self.rank_signals(signals)
-        
-        self.logger.info(f"Final ranked signals: {len(ranked_signals)}")
-        
-        return ranked_signals
+        return signals
     
     def apply_filters(self, prices: Dict, fundamentals: Dict) -> List[str]:
         """
         Filter symbols based on price, volume, market cap, float criteria.
         
         Args:
-            prices: Dict of ticker -> {price, volume, volume_20day_avg, ...}
-            fundamentals: Dict of ticker -> {market_cap_millions, float_millions, ...}
+            prices: DataFrame (or dict) of ticker -> {price, volume, volume_20day_avg, ...}
+            fundamentals: DataFrame (or dict) of ticker -> {market_cap_millions, float_millions, ...}
             
         Returns:
             List of tickers that pass all filters
         """
-        filtered = []
-        
         min_price = self.filters.get('min_price', 2.0)
         max_price = self.filters.get('max_price', 500.0)
         min_volume = self.filters.get('min_avg_volume', 500000)
         min_market_cap = self.filters.get('min_market_cap_millions', 100)
         max_float = self.filters.get('max_float_millions', 250)
         
-        for ticker, price_data in prices.items():
-            price = price_data.get('price', 0)
-            volume = price_data.get('volume', 0)
-            
-            # Price filter
-            if price < min_price or price > max_price:
-                self.logger.debug(f"  {ticker}: price {price} outside range [{min_price}, {max_price}]")
-                continue
-            
-            # Volume filter
-            if volume < min_volume:
-                self.logger.debug(f"  {ticker}: volume {volume} below {min_volume}")
-                continue
-            
-            # Fundamentals filters
-            fund_data = fundamentals.get(ticker, {})
-            market_cap = fund_data.get('market_cap_millions', 0)
-            float_shares = fund_data.get('float_millions', 0)
-            
-            if market_cap < min_market_cap:
-                self.logger.debug(f"  {ticker}: market cap {market_cap}M below {min_market_cap}M")
-                continue
-            
-            if float_shares > max_float:
-                self.logger.debug(f"  {ticker}: float {float_shares}M exceeds {max_float}M")
-                continue
-            
-            # Passed all filters
-            filtered.append(ticker)
+        # Missing fundamentals count as market cap 0, which a positive minimum always
+        # rejects, so only tickers with fundamentals need to be compared
+        require_fundamentals = min_market_cap > 0
+        tickers, price, volume, market_cap, float_shares = self._build_universe_arrays(
+            prices, fundamentals, require_fundamentals
+        )
+        
+        if require_fundamentals and self.logger.isEnabledFor(logging.DEBUG):
+            for ticker in self._as_frame(prices).index.difference(self._as_frame(fundamentals).index):
+                self.logger.debug("  %s: no fundamentals (market cap 0M below %sM)", ticker, min_market_cap)
         
-        return filtered
+        rejected = (
+            (price < min_price) | (price > max_price) | (volume < min_volume)
+            | (market_cap < min_market_cap) | (float_shares > max_float)
+        )
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(rejected):
+                self.logger.debug(
+                    "  %s: filtered out (price %s, volume %s, market cap %sM, float %sM)",
+                    tickers[i], price[i], volume[i], market_cap[i], float_shares[i]
+                )
+        
+        return tickers[~rejected].tolist()
     
     def generate_signals(
         self,
         symbols: List[str],
-        prices: Dict,
+        prices: Union[pd.DataFrame, Dict],
         news: Dict,
-        fundamentals: Dict,
+        fundamentals: Union[pd.DataFrame, Dict],
         sectors: Dict
     ) -> List[Dict]:
         """
@@ -119,7 +258,7 @@ class SignalProcessor:
         
         Args:
             symbols: Filtered list of tickers
-            prices: Price/volume data
+            prices: Price/volume data (DataFrame indexed by ticker)
             news: News and sentiment data
             fundamentals: Fundamental data
             sectors: Sector ETF data
@@ -127,122 +266,239 @@ class SignalProcessor:
         Returns:
             List of signal dicts: {ticker, composite_score, momentum_score, volume_score, ...}
         """
-        signals = []
+        return self.generate_signal_frame(symbols, prices, news, fundamentals, sectors).to_dict('records')
+    
+    def generate_signal_frame(
+        self,
+        symbols: List[str],
+        prices: Union[pd.DataFrame, Dict],
+        news: Dict,
+        fundamentals: Union[pd.DataFrame, Dict],
+        sectors: Dict
+    ) -> pd.DataFrame:
+        """
+        Columnar generate_signals: one row per symbol, scores rounded to 2 places.
         
-        for ticker in symbols:
-            price_data = prices.get(ticker, {})
-            news_data = news.get(ticker, [])
-            fund_data = fundamentals.get(ticker, {})
-            
-            # Calculate all 5 component scores
-            momentum_score = self.scoring_engine.calculate_momentum_score(
-                rsi=price_data.get('rsi', 50)
-            )
-            
-            volume_score = self.scoring_engine.calculate_volume_score(
-                current_volume=price_data.get('volume', 0),
-                avg_volume=price_data.get('volume_20day_avg', 0)
-            )
-            
-            # Relative strength vs sector
-            sector_etf = self._find_sector_etf(ticker)
-            stock_pct_change = price_data.get('pct_change', 0)
-            sector_pct_change = sectors.get(sector_etf, {}).get('pct_change', 0)
-            
-            relative_strength_score = self.scoring_engine.calculate_relative_strength_score(
-                stock_pct_change=stock_pct_change,
-                sector_pct_change=sector_pct_change
-            )
-            
-            # News sentiment score - count positive articles
-            positive_count = sum(1 for item in news_data if item.get('sentiment') == 'Positive')
-            news_sentiment_score = self.scoring_engine.calculate_news_sentiment_score(
-                positive_articles=positive_count,
-                total_articles=len(news_data) if news_data else 1
-            )
-            
-            # Catalyst score (simple keyword matching)
-            catalyst_keywords = ['beat', 'launch', 'expansion', 'partnership', 'acquisition']
-            catalyst_found = False
+        Returns:
+            DataFrame with a ticker column followed by the signal dict fields
+        """
+        price_rows = self._as_frame(prices).reindex(symbols)
+        
+        rsi = self._column(price_rows, 'rsi', 50)
+        current_price = self._column(price_rows, 'price', 0)
+        atr = self._column(price_rows, 'atr', 0)
+        pct_change = self._column(price_rows, 'pct_change', 0)
+        
+        # Risk falls back to ATR 1.0 on a $100 price, as in _calculate_risk_score
+        risk_atr = self._column(price_rows, 'atr', 1.0)
+        risk_price = self._column(price_rows, 'price', 100)
+        
+        # News sentiment counts and catalysts (simple keyword matching), one pass over each ticker's news.
+        # Catalysts are collected flat as (ticker index, days since published), grouped by ticker.
+        n = len(symbols)
+        positive_counts = np.zeros(n, dtype=np.float32)
+        total_counts = np.ones(n, dtype=np.float32)  # no news counts as 1 so the ratio is defined
+        catalyst_idx, catalyst_days = [], []
+        now = datetime.now(timezone.utc)
+        
+        for i, ticker in enumerate(symbols):
+            news_data = news.get(ticker)
+            if not news_data:
+                continue
             
+            positive = 0
             for article in news_data:
-                headline = article.get('headline', '').lower()
-                if any(keyword in headline for keyword in catalyst_keywords):
-                    catalyst_found = True
-                    break
+                if article.get('sentiment') == 'Positive':
+                    positive += 1
+                if self._is_catalyst_headline(article.get('headline', '')):
+                    catalyst_idx.append(i)
+                    catalyst_days.append(self._days_since(article.get('timestamp'), now))
             
-            # Pass catalyst data as list of dicts (empty or with one catalyst)
-            catalyst_list = [{'name': 'positive_catalyst', 'weight': 1.0}] if catalyst_found else []
-            catalyst_score = self.scoring_engine.calculate_catalyst_score(catalyst_list)
-            
-            # Calculate composite score
-            composite_score = self.scoring_engine.calculate_composite_score(
-                momentum_score=momentum_score,
-                volume_score=volume_score,
-                rel_strength_score=relative_strength_score,
-                news_sentiment_score=news_sentiment_score,
-                catalyst_score=catalyst_score
+            positive_counts[i] = positive
+            total_counts[i] = len(news_data)
+        
+        catalyst_scores = self.scoring_engine.calculate_catalyst_scores_batch(
+            np.array(catalyst_idx, dtype=np.int64), np.array(catalyst_days, dtype=np.int32), n
+        )
+        
+        # Relative strength vs sector
+        sector_pct_map = {etf: data.get('pct_change', 0) for etf, data in sectors.items()}
+        sector_pct_change = np.array(
+            [sector_pct_map.get(self._find_sector_etf(ticker), 0) for ticker in symbols],
+            dtype=np.float32
+        )
+        
+        current_volume = self._column(price_rows, 'volume', 0)
+        avg_volume = self._column(price_rows, 'volume_20day_avg', 0)
+        
+        if NUMBA_AVAILABLE:
+            # All scores and risk in one fused, parallel loop
+            scores = _score_signals_kernel(
+                rsi, current_volume, avg_volume, pct_change, sector_pct_change,
+                positive_counts, total_counts, catalyst_scores, risk_atr, risk_price,
+                self.scoring_engine.weight_vector, VOLUME_SURGE_THRESHOLD, RELATIVE_STRENGTH_THRESHOLD
             )
+            output_columns = dict(zip(FUSED_SCORE_COLUMNS, scores))
+        else:
+            # Calculate all 5 component scores and the composite in one batch
+            batch = pd.DataFrame({
+                'rsi': rsi,
+                'current_volume': current_volume,
+                'avg_volume': avg_volume,
+                'stock_pct': pct_change,
+                'sector_pct': sector_pct_change,
+                'pos_articles': positive_counts,
+                'total_articles': total_counts,
+                'catalyst_score': catalyst_scores
+            }, index=symbols)
+            composite_scores, components = self.scoring_engine.score_batch(batch)
             
-            # Calculate risk score
-            risk_score = self._calculate_risk_score(price_data)
-            
-            signal = {
-                'ticker': ticker,
-                'composite_score': round(composite_score, 2),
-                'momentum_score': round(momentum_score, 2),
-                'volume_score': round(volume_score, 2),
-                'relative_strength_score': round(relative_strength_score, 2),
-                'news_sentiment_score': round(news_sentiment_score, 2),
-                'catalyst_score': round(catalyst_score, 2),
-                'risk_score': round(risk_score, 2),
-                'current_price': round(price_data.get('price', 0), 2),
-                'atr': round(price_data.get('atr', 0), 2),
-                'pct_change_today': round(price_data.get('pct_change', 0), 2),
-                'rsi': round(price_data.get('rsi', 50), 2)
-            }
-            
-            signals.append(signal)
+            output_columns = {'composite_score': composite_scores.to_numpy()}
+            output_columns.update({column: components[column].to_numpy() for column in components.columns})
+            output_columns['risk_score'] = self._calculate_risk_score_batch(risk_atr, risk_price)
+        
+        output_columns.update({
+            'current_price': current_price,
+            'atr': atr,
+            'pct_change_today': pct_change,
+            'rsi': rsi
+        })
+        
+        signals = pd.DataFrame({
+            key: np.round(np.asarray(values, dtype=np.float64), 2)
+            for key, values in output_columns.items()
+        })
+        signals.insert(0, 'ticker', list(symbols))
         
         return signals
     
-    def rank_signals(self, signals: List[Dict]) -> List[Dict]:
+    def rank_signals(self, signals: Union[pd.DataFrame, List[Dict]]) -> List[Dict]:
         """
         Rank signals by composite score and apply risk controls.
         
         Args:
-            signals: List of signal dicts
+            signals: Signal DataFrame from generate_signal_frame, or list of signal dicts
             
         Returns:
             Top ranked signals filtered by score and risk thresholds
         """
-        # Sort by composite score (highest first)
-        ranked = sorted(signals, key=lambda x: x['composite_score'], reverse=True)
+        if not isinstance(signals, pd.DataFrame):
+            signals = pd.DataFrame(signals)
+        if signals.empty:
+            return []
         
         # Apply threshold filters from config
         min_score = self.signals_config.get('min_composite_score', 50)
         max_risk = self.signals_config.get('max_acceptable_risk_score', 75)
+        composite = signals['composite_score'].to_numpy()
+        keep = np.flatnonzero((composite >= min_score) & (signals['risk_score'].to_numpy() <= max_risk))
         
-        filtered_ranked = []
-        for signal in ranked:
-            if signal['composite_score'] >= min_score and signal['risk_score'] <= max_risk:
-                filtered_ranked.append(signal)
-        
-        # Limit to top N signals
+        # Limit to top N signals: an O(N) partition finds the N-th best score so only
+        # signals at or above it are sorted (ties at the cutoff included)
         max_signals = self.signals_config.get('max_signals_per_run', 10)
+        if 0 < max_signals < len(keep):
+            cutoff = -np.partition(-composite[keep], max_signals - 1)[max_signals - 1]
+            keep = keep[composite[keep] >= cutoff]
+        
+        # Sort by composite score (highest first); stable so ties keep input order
+        top = keep[np.argsort(-composite[keep], kind='stable')][:max_signals]
         
-        return filtered_ranked[:max_signals]
+        return signals.iloc[top].to_dict('records')
     
-    def _find_sector_etf(self, ticker: str) -> str:
+    def _build_universe_arrays(
+        self,
+        prices: Union[pd.DataFrame, Dict],
+        fundamentals: Union[pd.DataFrame, Dict],
+        require_fundamentals: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ingest prices and fundamentals once into parallel float32 arrays.
+        
+        Missing price, volume, market cap and float fields are 0, like the
+        .get(..., 0) defaults of the scalar filter. Tickers without fundamentals
+        get 0 market cap and float, or are left out entirely with
+        require_fundamentals. The result is cached for the most recent
+        (prices, fundamentals, require_fundamentals) call.
+        
+        Returns:
+            (tickers object array, price, volume, market_cap, float_shares)
+        """
+        cached = self._universe_cache
+        if (cached is not None and cached[0] is prices and cached[1] is fundamentals
+                and cached[2] == require_fundamentals):
+            return cached[3]
+        
+        price_frame = self._as_frame(prices)
+        fund_frame = self._as_frame(fundamentals)
+        if require_fundamentals:
+            # One hash-based intersection instead of building rows that can only fail
+            price_frame = price_frame[price_frame.index.isin(fund_frame.index)]
+            fund_frame = fund_frame.reindex(price_frame.index)
+        else:
+            fund_frame = fund_frame.reindex(price_frame.index, fill_value=0)
+        
+        arrays = (
+            price_frame.index.to_numpy(dtype=object),
+            self._column(price_frame, 'price', 0),
+            self._column(price_frame, 'volume', 0),
+            self._column(fund_frame, 'market_cap_millions', 0),
+            self._column(fund_frame, 'float_millions', 0)
+        )
+        self._universe_cache = (prices, fundamentals, require_fundamentals, arrays)
+        
+        return arrays
+    
+    @staticmethod
+    def _as_frame(data: Union[pd.DataFrame, Dict]) -> pd.DataFrame:
+        """Accept fetcher DataFrames as well as dicts of ticker -> record."""
+        if isinstance(data, pd.DataFrame):
+            return data
+        return pd.DataFrame.from_dict(data, orient='index')
+    
+    @staticmethod
+    def _column(frame: pd.DataFrame, name: str, default: float) -> np.ndarray:
+        """
+        Column as float32 array with default wherever the field is missing.
+        Records without the key (NaN once framed) and absent columns both get
+        default, like the .get(name, default) lookups of the per-ticker code.
+        """
+        if name in frame.columns:
+            return frame[name].fillna(default).to_numpy(dtype=np.float32)
+        return np.full(len(frame), default, dtype=np.float32)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_catalyst_headline(headline: str) -> bool:
+        """
+        Whether a headline mentions a catalyst keyword.
+        Memoized by text: the same headline recurs across tickers and refreshes.
+        """
+        return SignalProcessor._CATALYST_RE.search(headline) is not None
+    
+    @staticmethod
+    def _days_since(timestamp: Union[str, float, None], now: datetime) -> int:
+        """
+        Whole days between a timestamp and now (an aware UTC datetime).
+        
+        Accepts ISO strings, naive (local time) or with an offset or 'Z', and
+        epoch seconds as returned by Finnhub. Missing or unparseable
+        timestamps give UNDATED_CATALYST_DAYS.
+        """
+        try:
+            if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+                published = datetime.fromtimestamp(timestamp, timezone.utc)
+            elif isinstance(timestamp, str) and timestamp:
+                published = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).astimezone(timezone.utc)
+            else:
+                return UNDATED_CATALYST_DAYS
+        except (ValueError, TypeError, OverflowError, OSError):
+            return UNDATED_CATALYST_DAYS
+        return (now - published).days
+    
+    @staticmethod
+    def _find_sector_etf(ticker: str) -> str:
         """Find sector ETF for a given stock."""
-        # Simplified mapping; in production, use a database
-        sector_map = {
-            'AAPL': 'XLK', 'MSFT': 'XLK', 'GOOGL': 'XLK',  # Tech
-            'JPM': 'XLF', 'BAC': 'XLF',  # Finance
-            'XOM': 'XLE', 'CVX': 'XLE',  # Energy
-            'JNJ': 'XLV', 'PFE': 'XLV',  # Healthcare
-        }
-        return sector_map.get(ticker, 'XLK')  # Default to tech
+        return SECTOR_MAP.get(ticker, DEFAULT_SECTOR_ETF)
     
     def _calculate_risk_score(self, price_data: Dict) -> float:
         """
@@ -270,3 +526,29 @@ class SignalProcessor:
             risk = 20 + (atr_pct / 5) * 60
         
         return min(100, max(0, risk))
+    
+    @staticmethod
+    def _calculate_risk_score_batch(atr: np.ndarray, price: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _calculate_risk_score over ATR and price arrays.
+        
+        Returns:
+            Risk scores 0-100; NaN ATR scores 0, as in the scalar version
+        """
+        atr = np.asarray(atr, dtype=np.float64)
+        price = np.asarray(price, dtype=np.float64)
+        
+        # ATR as % of price; 0 where price is not positive
+        atr_pct = np.zeros_like(atr)
+        np.divide(atr, price, out=atr_pct, where=price > 0)
+        atr_pct *= 100
+        
+        # 20 below 1%, 80 above 5%, linear ramp in between
+        risk = np.divide(atr_pct, 5)
+        risk *= 60
+        risk += 20
+        risk[atr_pct < 1] = 20
+        risk[atr_pct > 5] = 80
+        
+        np.clip(risk, 0, 100, out=risk)
+        return np.nan_to_num(risk, copy=False)
@@ -3,17 +3,15 @@ Excel workbook writer.
 Generates multi-sheet Excel output with signals, news, parameters, etc.
 """
 
+import importlib.util
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 from pathlib import Path
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# openpyxl is imported lazily by write_workbook so CLI startup doesn't pay for it
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+if not OPENPYXL_AVAILABLE:
     # Try pandas Excel writer as fallback
     try:
         import pandas as pd
@@ -21,10 +19,31 @@ except ImportError:
     except ImportError:
         PANDAS_AVAILABLE = False
 
+# Preferred pandas engine for the fallback: one streaming pass, no cell graph
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
 
 class ExcelWriter:
     """Writes trading signals and data to Excel workbook."""
     
+    # Header named styles: name -> (fill color, font color, horizontal alignment); None keeps the default
+    HEADER_STYLES = {
+        'header_blue': ("4472C4", "FFFFFF", "center"),
+        'header_green': ("70AD47", "FFFFFF", None),
+        'header_gold': ("FFC000", None, None),
+        'header_orange': ("C55A11", "FFFFFF", None),
+        'header_purple': ("7030A0", "FFFFFF", None)
+    }
+    
+    # Header rows of the sheets sized from their column count
+    SIGNALS_HEADERS = ('Rank', 'Ticker', 'Price', 'Score', 'Momentum %', 'Volume Surge %',
+                       'Rel Strength %', 'News Sentiment', 'Risk %', 'Status')
+    HISTORY_HEADERS = ('Date', 'Ticker', 'Score', 'Momentum', 'Volume Surge', 'Action Taken', 'Outcome')
+    
+    # Uniform column widths for those sheets, one per header
+    SIGNALS_WIDTHS = (15,) * len(SIGNALS_HEADERS)
+    HISTORY_WIDTHS = (15,) * len(HISTORY_HEADERS)
+    
     def __init__(self, config: dict):
         """Initialize with configuration."""
         self.config = config
@@ -51,16 +70,23 @@ class ExcelWriter:
         # Create output directory if needed
         Path(self.output_file).parent.mkdir(parents=True, exist_ok=True)
         
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)  # Remove default sheet
+        from openpyxl import Workbook
+        
+        # Write-only mode streams rows to XML on append instead of keeping every cell in memory.
+        # Rows can only be appended, and column widths must be set before the first row.
+        wb = Workbook(write_only=True)
+        self._register_header_styles(wb)
+        
+        # One timestamp for the whole workbook
+        now_iso, today = self._now_strings()
         
         # Add sheets
-        self._add_dashboard_sheet(wb, signals, market_data)
+        self._add_dashboard_sheet(wb, signals, market_data, now_iso)
         self._add_signals_sheet(wb, signals)
-        self._add_news_sheet(wb, market_data)
+        self._add_news_sheet(wb, self._iter_news_rows(market_data))
         self._add_parameters_sheet(wb)
-        self._add_logs_sheet(wb)
-        self._add_history_sheet(wb, signals)
+        self._add_logs_sheet(wb, now_iso)
+        self._add_history_sheet(wb, signals, today)
         
         # Save workbook
         wb.save(self.output_file)
@@ -68,183 +94,186 @@ class ExcelWriter:
         
         return self.output_file
     
-    def _add_dashboard_sheet(self, wb, signals: List[Dict], market_data: Dict):
+    @staticmethod
+    def _now_strings() -> Tuple[str, str]:
+        """Current time as ("YYYY-MM-DD HH:MM:SS", "YYYY-MM-DD")."""
+        now_iso = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return now_iso, now_iso[:10]
+    
+    def _add_dashboard_sheet(self, wb, signals: List[Dict], market_data: Dict, now_iso: str):
         """Add Dashboard sheet with summary metrics."""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        
         ws = wb.create_sheet("Dashboard")
         
+        # Auto-fit columns
+        self._set_column_widths(ws, [20, 30])
+        
         # Header
-        ws['A1'] = "TRADING SIGNALS DASHBOARD"
-        ws['A1'].font = Font(bold=True, size=14)
+        title = WriteOnlyCell(ws, value="TRADING SIGNALS DASHBOARD")
+        title.font = Font(bold=True, size=14)
+        ws.append([title])
+        ws.append([])
         
         # Metrics
-        ws['A3'] = "Last Refresh"
-        ws['B3'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        ws['A4'] = "Top Pick"
-        ws['B4'] = signals[0]['ticker'] if signals else "N/A"
-        
-        ws['A5'] = "Top Score"
-        ws['B5'] = round(signals[0]['score'], 1) if signals else "N/A"
-        
-        ws['A6'] = "Num Signals"
-        ws['B6'] = len(signals)
-        
-        ws['A7'] = "Alerts Sent"
-        ws['B7'] = 0  # TODO: Track alerts
-        
-        # Auto-fit columns
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 30
+        ws.append(["Last Refresh", now_iso])
+        ws.append(["Top Pick", signals[0]['ticker'] if signals else "N/A"])
+        ws.append(["Top Score", round(signals[0]['composite_score'], 1) if signals else "N/A"])
+        ws.append(["Num Signals", len(signals)])
+        ws.append(["Alerts Sent", 0])  # TODO: Track alerts
     
     def _add_signals_sheet(self, wb, signals: List[Dict]):
         """Add Signals sheet with ranked list."""
         ws = wb.create_sheet("Signals")
         
-        # Headers
-        headers = ['Rank', 'Ticker', 'Price', 'Score', 'Momentum %', 'Volume Surge %',
-                   'Rel Strength %', 'News Sentiment', 'Risk %', 'Status']
-        ws.append(headers)
-        
-        # Style header
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
+        # Auto-fit columns
+        self._set_column_widths(ws, self.SIGNALS_WIDTHS)
         
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
+        # Headers
+        ws.append(self._header_cells(ws, self.SIGNALS_HEADERS, 'header_blue'))
         
         # Add signal rows
         for rank, signal in enumerate(signals, 1):
             ws.append([
                 rank,
                 signal.get('ticker', ''),
-                round(signal.get('price', 0), 2),
-                round(signal.get('score', 0), 1),
-                round(signal.get('momentum_pct', 0), 1),
-                round(signal.get('volume_surge_pct', 0), 1),
-                round(signal.get('rel_strength_pct', 0), 1),
-                signal.get('news_sentiment', 'Neutral'),
+                round(signal.get('current_price', 0), 2),
+                round(signal.get('composite_score', 0), 1),
+                round(signal.get('momentum_score', 0), 1),
+                round(signal.get('volume_score', 0), 1),
+                round(signal.get('relative_strength_score', 0), 1),
+                round(signal.get('news_sentiment_score', 50), 1),
                 round(signal.get('risk_score', 0), 1),
-                'BUY' if signal.get('score', 0) > 75 else 'HOLD'
+                'BUY' if signal.get('composite_score', 0) > 75 else 'HOLD'
             ])
-        
-        # Auto-fit columns
-        for col in ws.columns:
-            ws.column_dimensions[col[0].column_letter].width = 15
     
-    def _add_news_sheet(self, wb, market_data: Dict):
-        """Add News sheet with catalyst summaries."""
+    def _add_news_sheet(self, wb, news_rows: Iterable[Tuple]):
+        """Add News sheet with catalyst summaries, one row per article from news_rows."""
         ws = wb.create_sheet("News")
         
+        # Auto-fit columns
+        self._set_column_widths(ws, [10, 40, 15, 12, 15, 50])
+        
         # Headers
         headers = ['Ticker', 'Headline', 'Source', 'Sentiment', 'Time', 'Summary']
-        ws.append(headers)
-        
-        # Style header
-        header_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
+        ws.append(self._header_cells(ws, headers, 'header_green'))
         
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-        
-        # Auto-fit columns
-        ws.column_dimensions['A'].width = 10
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 50
+        # Each row is serialized on append, so only one article is resident at a time
+        for row in news_rows:
+            ws.append(row)
+    
+    def _iter_parameter_rows(self) -> Iterator[Tuple]:
+        """
+        Flatten config sections into (category, parameter, value, notes) rows.
+        List and dict values are written as text since a cell holds a single value.
+        """
+        for category, params in self.config.items():
+            if isinstance(params, dict):
+                for key, value in params.items():
+                    if isinstance(value, (list, tuple)):
+                        value = ", ".join(map(str, value))
+                    elif isinstance(value, dict):
+                        value = ", ".join(f"{k}: {v}" for k, v in value.items())
+                    yield (category, key, value, "Edit this value")
+    
+    @staticmethod
+    def _iter_news_rows(market_data: Dict) -> Iterator[Tuple]:
+        """Flatten market_data['news'] into (ticker, headline, source, sentiment, time, summary) rows."""
+        for ticker, articles in market_data.get('news', {}).items():
+            for article in articles:
+                yield (
+                    ticker,
+                    article.get('headline', ''),
+                    article.get('source', ''),
+                    article.get('sentiment', ''),
+                    article.get('timestamp', ''),
+                    article.get('summary', '')
+                )
     
     def _add_parameters_sheet(self, wb):
         """Add Parameters sheet (editable thresholds)."""
         ws = wb.create_sheet("Parameters")
         
-        # Headers
-        ws.append(['Category', 'Parameter', 'Value', 'Notes'])
-        
-        # Style header
-        header_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-        header_font = Font(bold=True)
+        # Auto-fit columns
+        self._set_column_widths(ws, [20, 35, 20, 40])
         
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
+        # Headers
+        ws.append(self._header_cells(ws, ['Category', 'Parameter', 'Value', 'Notes'], 'header_gold'))
         
         # Add all parameters from config
-        row = 2
-        for category, params in self.config.items():
-            if isinstance(params, dict):
-                for key, value in params.items():
-                    ws[f'A{row}'] = category
-                    ws[f'B{row}'] = key
-                    ws[f'C{row}'] = value
-                    ws[f'D{row}'] = "Edit this value"
-                    row += 1
-        
-        # Auto-fit columns
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 40
+        for row in self._iter_parameter_rows():
+            ws.append(row)
     
-    def _add_logs_sheet(self, wb):
+    def _add_logs_sheet(self, wb, now_iso: str):
         """Add Logs sheet (data refresh status & errors)."""
         ws = wb.create_sheet("Logs")
         
+        # Auto-fit columns
+        self._set_column_widths(ws, [20, 20, 15, 50])
+        
         # Headers
         headers = ['Timestamp', 'Action', 'Status', 'Details']
-        ws.append(headers)
-        
-        # Style header
-        header_fill = PatternFill(start_color="C55A11", end_color="C55A11", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
-        
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
+        ws.append(self._header_cells(ws, headers, 'header_orange'))
         
         # Sample log entry
-        ws.append([datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'Fetch Prices', 'Success', '500 symbols'])
-        
-        # Auto-fit columns
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 50
+        ws.append([now_iso, 'Fetch Prices', 'Success', '500 symbols'])
     
-    def _add_history_sheet(self, wb, signals: List[Dict]):
+    def _add_history_sheet(self, wb, signals: List[Dict], today: str):
         """Add History Report sheet (overwritten each refresh)."""
         ws = wb.create_sheet("History Report")
         
-        # Headers
-        headers = ['Date', 'Ticker', 'Score', 'Momentum', 'Volume Surge', 'Action Taken', 'Outcome']
-        ws.append(headers)
-        
-        # Style header
-        header_fill = PatternFill(start_color="7030A0", end_color="7030A0", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
+        # Auto-fit columns
+        self._set_column_widths(ws, self.HISTORY_WIDTHS)
         
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
+        # Headers
+        ws.append(self._header_cells(ws, self.HISTORY_HEADERS, 'header_purple'))
         
         # Add signal history rows
         for signal in signals[:10]:  # Last 10 signals
             ws.append([
-                datetime.now().strftime("%Y-%m-%d"),
+                today,
                 signal.get('ticker', ''),
-                round(signal.get('score', 0), 1),
-                round(signal.get('momentum_pct', 0), 1),
-                round(signal.get('volume_surge_pct', 0), 1),
-                'Trade Taken' if signal.get('score', 0) > 75 else 'Pending',
+                round(signal.get('composite_score', 0), 1),
+                round(signal.get('momentum_score', 0), 1),
+                round(signal.get('volume_score', 0), 1),
+                'Trade Taken' if signal.get('composite_score', 0) > 75 else 'Pending',
                 '+0.0%'  # TODO: Fetch actual outcome
             ])
+    
+    def _register_header_styles(self, wb):
+        """Register HEADER_STYLES on the workbook once so header cells share one style entry."""
+        from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+        
+        for name, (fill_color, font_color, horizontal) in self.HEADER_STYLES.items():
+            style = NamedStyle(name=name)
+            style.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+            style.font = Font(bold=True, color=font_color)
+            style.alignment = Alignment(horizontal=horizontal)
+            wb.add_named_style(style)
+    
+    @staticmethod
+    def _set_column_widths(ws, widths: Sequence[float]):
+        """
+        Set widths for columns A, B, ... in order, straight from column indices.
+        Write-only sheets need this before the first row is appended.
+        """
+        from openpyxl.utils import get_column_letter
         
-        # Auto-fit columns
-        for col in ws.columns:
-            ws.column_dimensions[col[0].column_letter].width = 15
+        for i, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+    
+    @staticmethod
+    def _header_cells(ws, headers: Sequence[str], style: str) -> List:
+        """Header row as write-only cells using a registered named style."""
+        from openpyxl.cell import WriteOnlyCell
+        
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = style
+            cells.append(cell)
+        return cells
     
     def _write_pandas_excel(self, signals: List[Dict], market_data: Dict) -> str:
         """Fallback using pandas (if openpyxl not available)."""
@@ -259,7 +288,12 @@ class ExcelWriter:
         # Convert signals to DataFrame
         df = pd.DataFrame(signals)
         
-        # Write to Excel with pandas
-        df.to_excel(self.output_file, sheet_name='Signals', index=False)
+        # Write to Excel with pandas. constant_memory is not enabled: pandas writes
+        # cells column by column, and xlsxwriter's row streaming would drop them.
+        if XLSXWRITER_AVAILABLE:
+            with pd.ExcelWriter(self.output_file, engine='xlsxwriter') as writer:
+                df.to_excel(writer, sheet_name='Signals', index=False)
+        else:
+            df.to_excel(self.output_file, sheet_name='Signals', index=False)
         
         return self.output_file
@@ -1,5 +1,6 @@
 """Integration tests for signal generation."""
 
+import asyncio
 import unittest
 from src.fetchers.data_fetcher import DataFetcher
 from src.processors.signal_processor import SignalProcessor
@@ -22,12 +23,25 @@ class TestSignalGeneration(unittest.TestCase):
         data = fetcher.fetch_all_data()
         self.assertIsNotNone(data)
     
+    def test_stream_pipeline(self):
+        """Test streamed fetch/score matches fetching everything before scoring."""
+        from src.main import run_pipeline
+        
+        self.config['signals']['min_composite_score'] = 0
+        fetcher = DataFetcher(self.config)
+        processor = SignalProcessor(self.config)
+        signals, data = asyncio.run(run_pipeline(fetcher, processor, batch_size=2))
+        
+        self.assertEqual(list(data['prices'].index), DataFetcher.DEFAULT_SYMBOLS)
+        self.assertEqual(set(data['news']), set(DataFetcher.DEFAULT_SYMBOLS))
+        self.assertTrue(signals)
+        self.assertEqual(signals, processor.process_data(data))
+    
     def test_signal_processing(self):
         """Test signal processing."""
         # Mock data
         mock_data = {'prices': {}, 'news': {}}
-        processor = SignalProcessor(self.config, mock_data)
-        signals = processor.generate_signals()
+        signals = SignalProcessor(self.config).process_data(mock_data)
         self.assertIsInstance(signals, list)
 
 
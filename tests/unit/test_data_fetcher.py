@@ -0,0 +1,147 @@
+"""Unit tests for data fetcher."""
+
+import asyncio
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.fetchers.data_fetcher import (
+    DataFetcher, PARQUET_AVAILABLE, compute_atr, rsi_from_averages, wilder_averages
+)
+
+
+class TestDataFetcher(unittest.TestCase):
+    """Test DataFetcher methods."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            'filters': {'min_price': 5, 'max_price': 200, 'min_avg_volume': 1000000}
+        }
+    
+    @unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_cache_serves_second_fetch(self):
+        """Test a cached API response within TTL is served to a later fetch."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.config['cache'] = {'enabled': True, 'directory': cache_dir}
+            
+            first = DataFetcher(self.config)
+            response = first.fetch_price_volume_data(['AAPL']).loc['AAPL'].to_dict()
+            articles = first.fetch_news_data(['AAPL'])['AAPL']
+            first._cache_put('prices', 'AAPL', response)
+            first._cache_put('news', 'AAPL', articles)
+            first.cache.flush()
+            
+            # Fresh fetcher reads metadata.parquet from disk
+            second = DataFetcher(self.config)
+            self.assertEqual(second.fetch_price_volume_data(['AAPL']).loc['AAPL', 'price'], response['price'])
+            self.assertEqual(second.fetch_news_data(['AAPL']), {'AAPL': articles})
+    
+    @unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_cache_skips_mock_fallback(self):
+        """Test mock fallback data is never written to the cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.config['cache'] = {'enabled': True, 'directory': cache_dir}
+            
+            fetcher = DataFetcher(self.config)
+            fetcher.fetch_all_data()
+            
+            for endpoint in ['prices', 'news', 'fundamentals']:
+                self.assertIsNone(DataFetcher(self.config)._cache_get(endpoint, 'AAPL'), endpoint)
+            self.assertIsNone(DataFetcher(self.config)._cache_get('sectors', 'XLK'))
+    
+    def test_cache_disabled_by_default(self):
+        """Test caching is off unless enabled in config."""
+        fetcher = DataFetcher(self.config)
+        self.assertIsNone(fetcher.cache)
+    
+    def test_stream_bounds_chunks_in_flight(self):
+        """Test the producer stops fetching ahead of a full queue and still delivers the sentinel."""
+        fetcher = DataFetcher(self.config)
+        symbols = fetcher.DEFAULT_SYMBOLS
+        started = []
+        fetch_symbol_batch = fetcher._fetch_symbol_batch
+        
+        async def counting_fetch(chunk):
+            started.append(chunk)
+            return await fetch_symbol_batch(chunk)
+        
+        fetcher._fetch_symbol_batch = counting_fetch
+        
+        async def run():
+            queue = asyncio.Queue(maxsize=1)
+            producer = asyncio.create_task(fetcher.stream_symbol_data(symbols, queue, batch_size=1))
+            await asyncio.sleep(0.2)
+            in_flight = len(started)
+            
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            return in_flight, queue.get_nowait()
+        
+        in_flight, sentinel = asyncio.run(run())
+        
+        self.assertEqual(in_flight, 1 + DataFetcher.MAX_CHUNKS_IN_FLIGHT)  # one queued plus the window
+        self.assertIsNone(sentinel)
+    
+    def test_stream_yields_batches_in_symbol_order(self):
+        """Test streamed batches arrive in symbol order whatever order their fetches finish in."""
+        fetcher = DataFetcher(self.config)
+        symbols = fetcher.DEFAULT_SYMBOLS
+        fetch_symbol_batch = fetcher._fetch_symbol_batch
+        
+        async def first_chunk_slowest(chunk):
+            await asyncio.sleep(0.05 if chunk[0] == symbols[0] else 0)
+            return await fetch_symbol_batch(chunk)
+        
+        fetcher._fetch_symbol_batch = first_chunk_slowest
+        
+        async def run():
+            queue = asyncio.Queue()
+            await fetcher.stream_symbol_data(symbols, queue, batch_size=2)
+            batches = []
+            while (batch := queue.get_nowait()) is not None:
+                batches.append(batch)
+            return batches
+        
+        batches = asyncio.run(run())
+        
+        self.assertEqual([ticker for batch in batches for ticker in batch['prices'].index], symbols)
+        self.assertEqual(sum(len(batch['news']) for batch in batches), len(symbols))
+    
+    def test_compute_atr_matches_wilder_loop(self):
+        """Test vectorized ATR against a per-bar Wilder smoothing loop."""
+        rng = np.random.default_rng(0)
+        close = pd.Series(100 + np.cumsum(rng.normal(0, 1, 50)))
+        high = close + rng.uniform(0, 2, 50)
+        low = close - rng.uniform(0, 2, 50)
+        
+        atr = compute_atr(high, low, close, n=14)
+        
+        expected = []
+        prev_close, prev_atr = None, None
+        for h, l, c in zip(high, low, close):
+            tr = h - l if prev_close is None else max(h - l, abs(h - prev_close), abs(l - prev_close))
+            prev_atr = tr if prev_atr is None else prev_atr + (tr - prev_atr) / 14
+            expected.append(prev_atr)
+            prev_close = c
+        
+        np.testing.assert_allclose(atr.to_numpy(), expected)
+    
+    def test_incremental_rsi_matches_full_recompute(self):
+        """Test O(1) RSI updates against recomputing over the whole window."""
+        rng = np.random.default_rng(1)
+        close = pd.Series(100 + np.cumsum(rng.normal(0, 1, 60)))
+        avg_gain, avg_loss = wilder_averages(close, 14)
+        expected = rsi_from_averages(avg_gain, avg_loss)
+        
+        fetcher = DataFetcher(self.config)
+        fetcher._rsi_state['AAPL'] = (avg_gain[29], avg_loss[29], close[29])
+        
+        for i in range(30, 60):
+            self.assertAlmostEqual(fetcher.update_rsi('AAPL', close[i]), expected[i])
+        
+        self.assertIsNone(fetcher.update_rsi('MSFT', 100.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Unit tests for Excel writer."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from src.processors.signal_processor import SignalProcessor
+from src.utils.excel_writer import ExcelWriter, OPENPYXL_AVAILABLE
+
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE, "openpyxl not installed")
+class TestExcelWriter(unittest.TestCase):
+    """Test ExcelWriter output."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            'filters': {'min_price': 5, 'max_price': 200},
+            'instruments': {'markets': ['S&P 500', 'OTC']},
+            'output': {'excel_file': str(Path(self.tmp_dir.name) / 'signals.xlsx')}
+        }
+        # Signals in the shape SignalProcessor actually emits
+        prices = {
+            'AAPL': {'price': 150.0, 'volume': 3000000, 'volume_20day_avg': 1000000, 'rsi': 80, 'atr': 2.0, 'pct_change': 8.0},
+            'MSFT': {'price': 370.0, 'volume': 1000000, 'volume_20day_avg': 1000000, 'rsi': 50, 'atr': 3.0, 'pct_change': 1.0}
+        }
+        self.signals = SignalProcessor(self.config).generate_signals(list(prices), prices, {}, {}, {})
+    
+    def tearDown(self):
+        """Remove the output directory."""
+        self.tmp_dir.cleanup()
+    
+    def test_write_workbook(self):
+        """Test every sheet is written with styled headers, widths and rows."""
+        import openpyxl
+        
+        news = {'AAPL': [{'headline': 'AAPL launches new product line', 'source': 'Reuters',
+                          'sentiment': 'Positive', 'timestamp': '2024-01-02T10:00:00'}]}
+        output_file = ExcelWriter(self.config).write_workbook(self.signals, {'news': news})
+        wb = openpyxl.load_workbook(output_file)
+        
+        self.assertEqual(wb.sheetnames, ['Dashboard', 'Signals', 'News', 'Parameters', 'Logs', 'History Report'])
+        
+        dashboard = wb['Dashboard']
+        self.assertEqual(dashboard['A1'].value, "TRADING SIGNALS DASHBOARD")
+        self.assertEqual(dashboard['B4'].value, 'AAPL')
+        self.assertEqual(dashboard['B5'].value, round(self.signals[0]['composite_score'], 1))
+        self.assertEqual(dashboard['B6'].value, 2)
+        
+        signals = wb['Signals']
+        self.assertEqual(signals['A1'].style, 'header_blue')
+        self.assertTrue(signals['A1'].font.b)
+        self.assertEqual(signals['A1'].fill.start_color.rgb, '004472C4')
+        self.assertEqual(signals['A1'].alignment.horizontal, 'center')
+        self.assertIsNone(wb['News']['A1'].alignment.horizontal)
+        self.assertEqual(wb['History Report']['A1'].style, 'header_purple')
+        self.assertEqual(wb['History Report']['A2'].value, dashboard['B3'].value[:10])
+        self.assertEqual(signals['J1'].value, 'Status')
+        self.assertEqual(signals.column_dimensions['J'].width, 15)
+        self.assertEqual([row[1] for row in signals.iter_rows(min_row=2, values_only=True)], ['AAPL', 'MSFT'])
+        self.assertEqual(signals['C2'].value, 150.0)
+        self.assertEqual(signals['E2'].value, round(self.signals[0]['momentum_score'], 1))
+        
+        self.assertEqual(
+            list(wb['News'].iter_rows(min_row=2, values_only=True)),
+            [('AAPL', 'AAPL launches new product line', 'Reuters', 'Positive', '2024-01-02T10:00:00', None)]
+        )
+        
+        parameters = wb['Parameters']
+        self.assertEqual(parameters.column_dimensions['B'].width, 35)
+        self.assertEqual(parameters['A2'].value, 'filters')
+        self.assertEqual(parameters['C3'].value, 200)
+        self.assertEqual(parameters['C4'].value, 'S&P 500, OTC')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 """Unit tests for scoring engine."""
 
 import unittest
+import numpy as np
+import pandas as pd
 from src.core.scoring import ScoringEngine
 
 
@@ -46,6 +48,83 @@ class TestScoringEngine(unittest.TestCase):
             min_threshold=5.0
         )
         self.assertGreater(score, 25)
+    
+    def test_momentum_scores_match_scalar(self):
+        """Test vectorized momentum scores against the scalar version."""
+        rsi = np.array([0, 20, 30, 50, 70, 80, 100, np.nan])
+        scores = self.engine.calculate_momentum_scores(rsi)
+        expected = [self.engine.calculate_momentum_score(r) for r in rsi]
+        np.testing.assert_allclose(scores, expected)
+    
+    def test_score_batch_matches_scalar(self):
+        """Test batch composite against per-ticker scalar scoring."""
+        df = pd.DataFrame({
+            'rsi': [20.0, 55.0, 80.0],
+            'current_volume': [3000000, 1000000, 500000],
+            'avg_volume': [1000000, 1000000, 0],
+            'stock_pct': [12.0, 1.0, -8.0],
+            'sector_pct': [1.0, 0.5, 0.0],
+            'pos_articles': [2, 0, 1],
+            'total_articles': [3, 0, 1],
+            'catalyst_score': [100.0, 0.0, 75.0]
+        }, index=['AAA', 'BBB', 'CCC'])
+        
+        composite, components = self.engine.score_batch(df)
+        
+        for ticker, row in df.iterrows():
+            expected = self.engine.calculate_composite_score(
+                momentum_score=self.engine.calculate_momentum_score(row['rsi']),
+                volume_score=self.engine.calculate_volume_score(row['current_volume'], row['avg_volume']),
+                rel_strength_score=self.engine.calculate_relative_strength_score(row['stock_pct'], row['sector_pct']),
+                news_sentiment_score=self.engine.calculate_news_sentiment_score(row['pos_articles'], row['total_articles']),
+                catalyst_score=row['catalyst_score']
+            )
+            self.assertAlmostEqual(composite[ticker], expected, places=4)  # float32 batch
+        
+        self.assertEqual(list(components.index), list(df.index))
+    
+    def test_catalyst_scores_csr(self):
+        """Test CSR catalyst scoring against the list-of-dicts version."""
+        per_ticker = [[3, 20, 90], [], [40], [1]]
+        offsets = np.cumsum([0] + [len(days) for days in per_ticker])
+        days_ago = np.array([d for days in per_ticker for d in days])
+        
+        scores = self.engine.calculate_catalyst_scores_csr(offsets, days_ago)
+        expected = [
+            self.engine.calculate_catalyst_score([{'days_ago': d} for d in days])
+            for days in per_ticker
+        ]
+        np.testing.assert_allclose(scores, expected)
+    
+    def test_catalyst_scores_batch(self):
+        """Test grouped catalyst scoring, including tickers with no catalysts."""
+        ticker_idx = np.array([0, 0, 0, 2, 3])
+        days_ago = np.array([3, 20, 90, 40, 1])
+        
+        scores = self.engine.calculate_catalyst_scores_batch(ticker_idx, days_ago, n_tickers=5)
+        np.testing.assert_allclose(scores, [50.0, 0.0, 0.0, 100.0, 0.0])
+    
+    def test_composite_score_batch(self):
+        """Test array composite matches the scalar weighted average."""
+        scores_matrix = np.array([[80.0, 10.0, 25.0, 66.7, 100.0], [0.0, 0.0, 0.0, 0.0, 0.0]])
+        expected = [self.engine.calculate_composite_score(*row) for row in scores_matrix]
+        
+        np.testing.assert_allclose(self.engine.calculate_composite_score_batch(*scores_matrix.T), expected)
+    
+    def test_score_batch_uses_configured_weights(self):
+        """Test config weights override the defaults in the batch composite."""
+        engine = ScoringEngine({'weights': {'momentum': 1.0, 'volume': 0.0, 'relative_strength': 0.0,
+                                            'news_sentiment': 0.0, 'catalysts': 0.0}})
+        batch = pd.DataFrame({
+            'rsi': [20.0, 50.0, 90.0], 'current_volume': [3e6] * 3, 'avg_volume': [1e6] * 3,
+            'stock_pct': [8.0] * 3, 'sector_pct': [1.0] * 3, 'pos_articles': [2.0] * 3,
+            'total_articles': [3.0] * 3, 'catalyst_score': [100.0] * 3
+        })
+        
+        composite, components = engine.score_batch(batch)
+        
+        np.testing.assert_allclose(composite, components['momentum_score'])
+        self.assertEqual(engine.weights['catalysts'], 0.0)
 
 
 if __name__ == '__main__':
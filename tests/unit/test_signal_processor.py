@@ -0,0 +1,187 @@
+"""Unit tests for signal processor."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+from src.core.scoring import RELATIVE_STRENGTH_THRESHOLD, VOLUME_SURGE_THRESHOLD
+from src.processors.signal_processor import (
+    FUSED_SCORE_COLUMNS, UNDATED_CATALYST_DAYS, SignalProcessor, _score_signals_kernel
+)
+
+
+class TestSignalProcessor(unittest.TestCase):
+    """Test SignalProcessor methods."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            'filters': {
+                'min_price': 5, 'max_price': 200, 'min_avg_volume': 1000000,
+                'min_market_cap_millions': 100, 'max_float_millions': 250
+            }
+        }
+        self.processor = SignalProcessor(self.config)
+    
+    def test_apply_filters(self):
+        """Test each filter rejects its ticker and missing fields or fundamentals count as 0."""
+        prices = {
+            'PASS': {'price': 50.0, 'volume': 2000000},
+            'CHEAP': {'price': 1.0, 'volume': 2000000},
+            'PRICEY': {'price': 300.0, 'volume': 2000000},
+            'THIN': {'price': 50.0, 'volume': 1000},
+            'SMALL': {'price': 50.0, 'volume': 2000000},
+            'FLOAT': {'price': 50.0, 'volume': 2000000},
+            'NOFUND': {'price': 50.0, 'volume': 2000000},
+            'NAN': {'price': np.nan, 'volume': 2000000},
+            'NOPRICE': {'volume': 2000000},
+            'NOVOL': {'price': 50.0},
+            'NOCAP': {'price': 50.0, 'volume': 2000000},
+            'NOFLOAT': {'price': 50.0, 'volume': 2000000}
+        }
+        fundamentals = {
+            ticker: {'market_cap_millions': 1000, 'float_millions': 10}
+            for ticker in ['PASS', 'CHEAP', 'PRICEY', 'THIN', 'NAN', 'NOPRICE', 'NOVOL']
+        }
+        fundamentals['SMALL'] = {'market_cap_millions': 50, 'float_millions': 10}
+        fundamentals['FLOAT'] = {'market_cap_millions': 1000, 'float_millions': 500}
+        fundamentals['NOCAP'] = {'float_millions': 10}
+        fundamentals['NOFLOAT'] = {'market_cap_millions': 1000}
+        
+        # Missing (or NaN) fields default to 0: price, volume and market cap fail, float 0 passes
+        self.assertEqual(self.processor.apply_filters(prices, fundamentals), ['PASS', 'NOFLOAT'])
+    
+    def test_generate_signals_defaults_missing_fields(self):
+        """Test records missing fields score like records holding the per-field defaults."""
+        prices = {
+            'PARTIAL': {'price': 50.0},
+            'EMPTY': {},
+            'FULL': {'price': 50.0, 'volume': 0, 'volume_20day_avg': 0, 'rsi': 50, 'atr': 0, 'pct_change': 0}
+        }
+        
+        signals = self.processor.generate_signals(list(prices), prices, {}, {}, {})
+        partial, empty, full = signals
+        
+        for field in ['composite_score', 'momentum_score', 'volume_score', 'current_price', 'atr', 'rsi']:
+            self.assertEqual(partial[field], full[field], field)
+        self.assertEqual(partial['momentum_score'], 37.5)  # RSI 50, not a NaN RSI scoring 0
+        self.assertEqual(partial['risk_score'], 44.0)  # ATR 1.0 on $50 price
+        self.assertEqual(empty['risk_score'], 32.0)  # ATR 1.0 on $100 price
+        self.assertEqual(empty['current_price'], 0.0)
+    
+    def test_catalyst_keywords_match_substrings(self):
+        """Test catalyst matching is case-insensitive and matches inside words."""
+        matches = [
+            SignalProcessor._is_catalyst_headline(headline)
+            for headline in ['AAPL LAUNCHES new product line', 'Q4 earnings beats estimates', 'CEO interview']
+        ]
+        self.assertEqual(matches, [True, True, False])
+    
+    def test_catalyst_scores_from_dated_headlines(self):
+        """Test catalyst headlines are scored by age and averaged per ticker."""
+        now = datetime.now()
+        
+        def article(headline, days_ago=None):
+            timestamp = (now - timedelta(days=days_ago, hours=1)).isoformat() if days_ago is not None else ''
+            return {'headline': headline, 'sentiment': 'Neutral', 'timestamp': timestamp}
+        
+        news = {
+            'FRESH': [article('FRESH launches new product line', 1), article('CEO interview', 100)],
+            'MIXED': [article('MIXED beats estimates', 3), article('MIXED partnership', 20), article('MIXED acquisition', 60)],
+            'UNDATED': [article('UNDATED expansion plans')],
+            'NONE': [article('CEO interview', 1)]
+        }
+        prices = {ticker: {'price': 50.0} for ticker in news}
+        
+        signals = self.processor.generate_signals(list(news), prices, news, {}, {})
+        
+        self.assertEqual([signal['catalyst_score'] for signal in signals], [100.0, 50.0, 0.0, 0.0])
+    
+    def test_catalyst_timestamp_formats(self):
+        """Test aware ISO and epoch timestamps are dated and unparseable ones count as undated."""
+        now = datetime.now(timezone.utc)
+        recent, old = now - timedelta(days=2), now - timedelta(days=20)
+        timestamps = {
+            'AWARE': recent.isoformat(),
+            'ZULU': old.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'OFFSET': recent.astimezone(timezone(timedelta(hours=-5))).isoformat(),
+            'EPOCH': int(recent.timestamp()),
+            'EPOCHF': old.timestamp(),
+            'BAD': 'yesterday',
+            'NONE': None
+        }
+        news = {
+            ticker: [{'headline': f'{ticker} partnership', 'sentiment': 'Neutral', 'timestamp': timestamp}]
+            for ticker, timestamp in timestamps.items()
+        }
+        prices = {ticker: {'price': 50.0} for ticker in news}
+        
+        signals = self.processor.generate_signals(list(news), prices, news, {}, {})
+        
+        self.assertEqual(
+            [signal['catalyst_score'] for signal in signals], [100.0, 50.0, 100.0, 100.0, 50.0, 0.0, 0.0]
+        )
+        self.assertEqual(SignalProcessor._days_since('2024-13-45', now), UNDATED_CATALYST_DAYS)
+        self.assertEqual(SignalProcessor._days_since(float('nan'), now), UNDATED_CATALYST_DAYS)
+    
+    def test_rank_signals(self):
+        """Test ranking drops weak and risky signals, sorts stably and caps the count."""
+        processor = SignalProcessor({'signals': {'min_composite_score': 50, 'max_signals_per_run': 3}})
+        signals = [
+            {'ticker': 'A', 'composite_score': 60.0, 'risk_score': 20.0},
+            {'ticker': 'B', 'composite_score': 40.0, 'risk_score': 20.0},
+            {'ticker': 'C', 'composite_score': 90.0, 'risk_score': 80.0},
+            {'ticker': 'D', 'composite_score': 70.0, 'risk_score': 20.0},
+            {'ticker': 'E', 'composite_score': 60.0, 'risk_score': 20.0},
+            {'ticker': 'F', 'composite_score': 55.0, 'risk_score': 20.0}
+        ]
+        
+        for data in (signals, pd.DataFrame(signals)):
+            ranked = processor.rank_signals(data)
+            self.assertEqual([signal['ticker'] for signal in ranked], ['D', 'A', 'E'])
+        
+        self.assertEqual(processor.rank_signals([]), [])
+    
+    def test_risk_score_batch_matches_scalar(self):
+        """Test vectorized risk scores against the scalar version, edge cases included."""
+        atr = np.array([0.5, 2.0, 4.0, 10.0, 2.0, 2.0, np.nan])
+        price = np.array([100.0, 100.0, 100.0, 100.0, 0.0, np.nan, 100.0])
+        expected = [
+            self.processor._calculate_risk_score({'atr': a, 'price': p}) for a, p in zip(atr, price)
+        ]
+        
+        np.testing.assert_array_equal(SignalProcessor._calculate_risk_score_batch(atr, price), expected)
+    
+    def test_fused_kernel_matches_batch_scoring(self):
+        """Test the fused kernel against score_batch and the risk batch, NaN inputs included."""
+        rng = np.random.default_rng(0)
+        n = 200
+        batch = pd.DataFrame({
+            'rsi': rng.uniform(0, 100, n),
+            'current_volume': rng.uniform(0, 5e7, n),
+            'avg_volume': rng.choice([0, 1e7, 2e7], n),
+            'stock_pct': rng.uniform(-20, 20, n),
+            'sector_pct': rng.uniform(-5, 5, n),
+            'pos_articles': rng.integers(0, 5, n),
+            'total_articles': rng.integers(0, 5, n),
+            'catalyst_score': rng.choice([0, 50, 75, 100], n)
+        }).astype(np.float32)
+        batch.loc[::7, 'rsi'] = np.nan
+        atr = rng.uniform(0, 10, n).astype(np.float32)
+        price = rng.choice([0, 20, 100], n).astype(np.float32)
+        
+        engine = self.processor.scoring_engine
+        composite, components = engine.score_batch(batch)
+        expected = [composite.to_numpy(), *components.to_numpy().T, SignalProcessor._calculate_risk_score_batch(atr, price)]
+        
+        scores = _score_signals_kernel(
+            *[batch[column].to_numpy() for column in batch.columns], atr, price,
+            engine.weight_vector, VOLUME_SURGE_THRESHOLD, RELATIVE_STRENGTH_THRESHOLD
+        )
+        
+        for column, actual, want in zip(FUSED_SCORE_COLUMNS, scores, expected):
+            np.testing.assert_allclose(actual, want, rtol=1e-5, atol=1e-4, err_msg=column)
+
+
+if __name__ == '__main__':
+    unittest.main()